@@ -73,6 +73,7 @@ SORT_KEYS = {
     "position_desc": "position DESC",
     "artist_name": "artists.search_name ASC",
     "artist_name_desc": "artists.search_name DESC",
+    "item_id": "item_id ASC",
     "random": "RANDOM()",
     "random_play_count": "RANDOM(), play_count ASC",
 }
@@ -158,7 +159,7 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
         query = f"{self.db_table}.name = :name OR {self.db_table}.sort_name = :sort_name"
         query_params = {"name": item.name, "sort_name": item.sort_name}
         async for db_item in self.iter_library_items(
-            extra_query=query, extra_query_params=query_params
+            order_by=None, extra_query=query, extra_query_params=query_params
         ):
             if compare_media_item(db_item, item, True):
                 return db_item.item_id
@@ -250,13 +251,37 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
         self,
         favorite: bool | None = None,
         search: str | None = None,
-        order_by: str = "sort_name",
+        order_by: str | None = "sort_name",
         provider: str | None = None,
         extra_query: str | None = None,
         extra_query_params: dict[str, Any] | None = None,
     ) -> AsyncGenerator[ItemCls, None]:
         """Iterate all in-database items."""
         limit: int = 500
+        if not order_by:
+            # no specific ordering requested: use keyset pagination on the item_id,
+            # an offset forces sqlite to step over all previous rows again for each page
+            last_item_id = 0
+            while True:
+                query_parts = [f"{self.db_table}.item_id > :last_item_id"]
+                if extra_query:
+                    # wrap in parentheses so an OR in the extra query can not bypass the keyset
+                    query_parts.append(f"({extra_query.removeprefix('WHERE ')})")
+                next_items = await self._get_library_items_by_query(
+                    favorite=favorite,
+                    search=search,
+                    limit=limit,
+                    order_by="item_id",
+                    provider=provider,
+                    extra_query_parts=query_parts,
+                    extra_query_params={**(extra_query_params or {}), "last_item_id": last_item_id},
+                )
+                for item in next_items:
+                    yield item
+                if len(next_items) < limit:
+                    break
+                last_item_id = int(next_items[-1].item_id)
+            return
         offset: int = 0
         while True:
             next_items = await self.library_items(
@@ -399,9 +424,22 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
         assert provider_instance_id_or_domain
         if provider_instance_id_or_domain == "library":
             return await self.get_library_item(item_id)
-        for item in await self.get_library_items_by_prov_id(
-            provider_instance_id_or_domain=provider_instance_id_or_domain,
-            provider_item_id=item_id,
+        # single row lookup with a direct join on the provider_mappings indexes
+        join = (
+            f"JOIN provider_mappings ON provider_mappings.item_id = {self.db_table}.item_id "
+            "AND provider_mappings.media_type = :prov_media_type "
+            "AND provider_mappings.provider_item_id = :prov_item_id "
+            "AND (provider_mappings.provider_instance = :prov_id "
+            "OR provider_mappings.provider_domain = :prov_id)"
+        )
+        for item in await self._get_library_items_by_query(
+            limit=1,
+            extra_query_params={
+                "prov_media_type": self.media_type.value,
+                "prov_item_id": item_id,
+                "prov_id": provider_instance_id_or_domain,
+            },
+            extra_join_parts=[join],
         ):
             return item
         return None
@@ -465,16 +503,16 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
         assert provider_instance_id_or_domain != "library"
         assert provider_domain != "library"
         assert provider_instance != "library"
-        subquery_parts: list[str] = []
-        query_params: dict[str, Any] = {}
+        subquery_parts: list[str] = ["provider_mappings.media_type = :media_type"]
+        query_params: dict[str, Any] = {"media_type": self.media_type.value}
         if provider_instance:
-            query_params = {"prov_id": provider_instance}
+            query_params["prov_id"] = provider_instance
             subquery_parts.append("provider_mappings.provider_instance = :prov_id")
         elif provider_domain:
-            query_params = {"prov_id": provider_domain}
+            query_params["prov_id"] = provider_domain
             subquery_parts.append("provider_mappings.provider_domain = :prov_id")
         else:
-            query_params = {"prov_id": provider_instance_id_or_domain}
+            query_params["prov_id"] = provider_instance_id_or_domain
             subquery_parts.append(
                 "(provider_mappings.provider_instance = :prov_id "
                 "OR provider_mappings.provider_domain = :prov_id)"
@@ -520,7 +558,8 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
             return
         match = {"item_id": db_id}
         await self.mass.music.database.update(self.db_table, match, {"favorite": favorite})
-        library_item = await self.get_library_item(db_id)
+        # only the favorite column changed, no need to fetch the item again
+        library_item.favorite = favorite
         self.mass.signal_event(EventType.MEDIA_ITEM_UPDATED, library_item.uri, library_item)
 
     async def get_provider_item(
@@ -733,10 +772,12 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
         if provider:
             join_parts.append(
                 f"JOIN provider_mappings ON provider_mappings.item_id = {self.db_table}.item_id "
-                f"AND provider_mappings.media_type = '{self.media_type.value}' "
-                f"AND (provider_mappings.provider_instance = '{provider}' "
-                f"OR provider_mappings.provider_domain = '{provider}')"
+                "AND provider_mappings.media_type = :provider_media_type "
+                "AND (provider_mappings.provider_instance = :provider_filter "
+                "OR provider_mappings.provider_domain = :provider_filter)"
             )
+            query_params["provider_media_type"] = self.media_type.value
+            query_params["provider_filter"] = provider
         # prevent duplicate where statement
         query_parts = [x[5:] if x.lower().startswith("where ") else x for x in query_parts]
         # concetenate all join and/or where queries
@@ -768,15 +809,17 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
         if overwrite:
             # on overwrite, clear the provider_mappings table first
             # this is done for filesystem provider changing the path (and thus item_id)
-            await self.mass.music.database.delete(
-                DB_TABLE_PROVIDER_MAPPINGS,
+            # NOTE: not committed here, this is committed together with the inserts below.
+            # The db connection is shared so this is not atomic, if the inserts fail the
+            # mappings are reconciled by the next update of the item (e.g. the next sync).
+            await self.mass.music.database.execute(
+                f"DELETE FROM {DB_TABLE_PROVIDER_MAPPINGS} "
+                "WHERE media_type = :media_type AND item_id = :item_id",
                 {"media_type": self.media_type.value, "item_id": db_id},
             )
-        for provider_mapping in provider_mappings:
-            if not provider_mapping.provider_instance:
-                continue
-            await self.mass.music.database.insert_or_replace(
-                DB_TABLE_PROVIDER_MAPPINGS,
+        await self.mass.music.database.insert_many(
+            DB_TABLE_PROVIDER_MAPPINGS,
+            [
                 {
                     "media_type": self.media_type.value,
                     "item_id": db_id,
@@ -787,8 +830,12 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
                     "url": provider_mapping.url,
                     "audio_format": serialize_to_json(provider_mapping.audio_format),
                     "details": provider_mapping.details,
-                },
-            )
+                }
+                for provider_mapping in provider_mappings
+                if provider_mapping.provider_instance
+            ],
+            allow_replace=True,
+        )
 
     @staticmethod
     def _parse_db_row(db_row: Mapping) -> dict[str, Any]:
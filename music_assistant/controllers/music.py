@@ -8,6 +8,7 @@ import os
 import shutil
 from collections.abc import Sequence
 from contextlib import suppress
+from copy import copy
 from itertools import zip_longest
 from math import inf
 from typing import TYPE_CHECKING, Final, cast
@@ -65,6 +66,7 @@ from music_assistant.helpers.uri import parse_uri
 from music_assistant.helpers.util import TaskManager
 from music_assistant.models.core_controller import CoreController
 
+from .cache import MemoryCache
 from .media.albums import AlbumsController
 from .media.artists import ArtistsController
 from .media.audiobooks import AudiobooksController
@@ -74,6 +76,8 @@ from .media.radio import RadioController
 from .media.tracks import TracksController
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from music_assistant_models.config_entries import CoreConfig
     from music_assistant_models.media_items import Audiobook, PodcastEpisode
 
@@ -113,6 +117,8 @@ class MusicController(CoreController):
         )
         self.manifest.icon = "archive-music"
         self._sync_task: asyncio.Task | None = None
+        # small in-memory cache of loudness measurements to avoid a db hop on every track start
+        self._loudness_cache = MemoryCache(256)
 
     async def get_config_entries(
         self,
@@ -643,14 +649,22 @@ class MusicController(CoreController):
         """
         ctrl = self.get_controller(media_type)
         item = await ctrl.get_library_item(library_item_id)
-        # remove from all providers
-        for provider_mapping in item.provider_mappings:
-            if prov_controller := self.mass.get_provider(provider_mapping.provider_instance):
-                # we simply try to remove it on the provider library
-                # NOTE that the item may not be in the provider's library at all
-                # so we need to be a bit forgiving here
-                with suppress(NotImplementedError):
-                    await prov_controller.library_remove(provider_mapping.item_id, item.media_type)
+
+        async def _remove_from_provider(provider: MusicProvider, prov_item_id: str) -> None:
+            # we simply try to remove it on the provider library
+            # NOTE that the item may not be in the provider's library at all
+            # so we need to be a bit forgiving here
+            with suppress(NotImplementedError):
+                await provider.library_remove(prov_item_id, item.media_type)
+
+        # remove from all providers (concurrently, as these are independent calls)
+        await asyncio.gather(
+            *(
+                _remove_from_provider(prov_controller, provider_mapping.item_id)
+                for provider_mapping in item.provider_mappings
+                if (prov_controller := self.mass.get_provider(provider_mapping.provider_instance))
+            )
+        )
         await ctrl.remove_item_from_library(library_item_id, recursive)
 
     @api_command("music/library/add_item")
@@ -666,14 +680,17 @@ class MusicController(CoreController):
                 item.item_id,
                 item.provider,
             )
-        # add to provider(s) library first
+        # add to provider(s) library first (concurrently, as these are independent calls)
+        add_tasks: list[Awaitable[bool]] = []
         for prov_mapping in item.provider_mappings:
             provider = self.mass.get_provider(prov_mapping.provider_instance)
-            if provider.library_edit_supported(item.media_type):
-                prov_item = item
+            if provider and provider.library_edit_supported(item.media_type):
+                # every provider gets its own (shallow) copy of the item with its own id
+                prov_item = copy(item)
                 prov_item.provider = prov_mapping.provider_instance
                 prov_item.item_id = prov_mapping.item_id
-                await provider.library_add(prov_item)
+                add_tasks.append(provider.library_add(prov_item))
+        await asyncio.gather(*add_tasks)
         # add (or overwrite) to library
         ctrl = self.get_controller(item.media_type)
         library_item = await ctrl.add_item_to_library(item, overwrite_existing)
@@ -796,6 +813,8 @@ class MusicController(CoreController):
         if album_loudness is not None:
             values["loudness_album"] = album_loudness
         await self.database.insert_or_replace(DB_TABLE_LOUDNESS_MEASUREMENTS, values)
+        # invalidate the memory cache, the next lookup will fetch the stored values
+        self._loudness_cache.pop((item_id, provider.lookup_key, media_type.value))
 
     async def get_loudness(
         self,
@@ -806,6 +825,10 @@ class MusicController(CoreController):
         """Get (EBU-R128) Integrated Loudness Measurement for a mediaitem in db."""
         if not (provider := self.mass.get_provider(provider_instance_id_or_domain)):
             return None
+        cache_key = (item_id, provider.lookup_key, media_type.value)
+        if cache_key in self._loudness_cache:
+            return self._loudness_cache[cache_key]
+        result: tuple[float, float] | None = None
         db_row = await self.database.get_row(
             DB_TABLE_LOUDNESS_MEASUREMENTS,
             {
@@ -815,9 +838,9 @@ class MusicController(CoreController):
             },
         )
         if db_row and db_row["loudness"] != inf and db_row["loudness"] != -inf:
-            return (db_row["loudness"], db_row["loudness_album"])
-
-        return None
+            result = (db_row["loudness"], db_row["loudness_album"])
+        self._loudness_cache[cache_key] = result
+        return result
 
     @api_command("music/mark_played")
     async def mark_item_played(
@@ -1394,6 +1417,7 @@ class MusicController(CoreController):
         await self.close()
         db_path = os.path.join(self.mass.storage_path, "library.db")
         await asyncio.to_thread(os.remove, db_path)
+        self._loudness_cache.clear()
         await self._setup_database()
         # initiate full sync
         self.start_sync()
@@ -407,6 +407,7 @@ class PlayerQueuesController(CoreController):
 
         media_items: list[MediaItemType] = []
         radio_source: list[MediaItemType] = []
+        items_to_resolve: list[MediaItemType] = []
         # resolve all media items
         for item in media:
             try:
@@ -442,12 +443,26 @@ class PlayerQueuesController(CoreController):
                 if radio_mode:
                     radio_source.append(media_item)
                 else:
-                    media_items += await self._resolve_media_items(media_item, start_item)
+                    items_to_resolve.append(media_item)
 
             except MusicAssistantError as err:
                 # invalid MA uri or item not found error
                 self.logger.warning("Skipping %s: %s", item, str(err))
 
+        # unwrap the collected items (e.g. album/playlist tracks) concurrently,
+        # while preserving the requested order
+        results = await asyncio.gather(
+            *(self._resolve_media_items(x, start_item) for x in items_to_resolve),
+            return_exceptions=True,
+        )
+        for media_item, result in zip(items_to_resolve, results, strict=True):
+            if isinstance(result, MusicAssistantError):
+                self.logger.warning("Skipping %s: %s", media_item.uri, str(result))
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            media_items += result
+
         # overwrite or append radio source items
         if option not in (QueueOption.ADD, QueueOption.NEXT):
             queue.radio_source = radio_source
@@ -11,8 +11,9 @@ from __future__ import annotations
 import asyncio
 import functools
 import time
+from collections.abc import Awaitable
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Concatenate, Final, ParamSpec, TypeVar, cast
 
 from music_assistant_models.constants import (
     PLAYER_CONTROL_FAKE,
@@ -63,7 +64,7 @@ from music_assistant.models.player_provider import PlayerProvider
 from music_assistant.models.plugin import PluginProvider, PluginSource
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Coroutine, Iterator
+    from collections.abc import Callable, Coroutine, Iterator
 
     from music_assistant_models.config_entries import CoreConfig, PlayerConfig
     from music_assistant_models.player_queue import PlayerQueue
@@ -73,6 +74,9 @@ _PlayerControllerT = TypeVar("_PlayerControllerT", bound="PlayerController")
 _R = TypeVar("_R")
 _P = ParamSpec("_P")
 
+# player state keys that should not be considered a (meaningful) change
+IGNORE_CHANGED_KEYS: Final = frozenset({"elapsed_time_last_updated", "seq_no", "last_poll"})
+
 
 def handle_player_command(
     func: Callable[Concatenate[_PlayerControllerT, _P], Awaitable[_R]],
@@ -207,7 +211,7 @@ class PlayerController(CoreController):
             return
         # send to player provider
         async with self._player_throttlers[player.player_id]:
-            if player_provider := self.get_player_provider(player.player_id):
+            if player_provider := self._get_provider_for_player(player):
                 await player_provider.cmd_stop(player.player_id)
 
     @api_command("players/cmd/play")
@@ -229,7 +233,7 @@ class PlayerController(CoreController):
             await self.mass.player_queues.play(active_queue.queue_id)
             return
         # send to player provider
-        player_provider = self.get_player_provider(player.player_id)
+        player_provider = self._get_provider_for_player(player)
         async with self._player_throttlers[player.player_id]:
             await player_provider.cmd_play(player.player_id)
 
@@ -249,7 +253,7 @@ class PlayerController(CoreController):
             )
             await self.cmd_stop(player.player_id)
             return
-        player_provider = self.get_player_provider(player.player_id)
+        player_provider = self._get_provider_for_player(player)
         await player_provider.cmd_pause(player.player_id)
 
         async def _watch_pause(_player_id: str) -> None:
@@ -275,16 +279,16 @@ class PlayerController(CoreController):
             self.mass.create_task(_watch_pause(player_id))
 
     @api_command("players/cmd/play_pause")
-    async def cmd_play_pause(self, player_id: str) -> None:
+    def cmd_play_pause(self, player_id: str) -> Awaitable[None]:
         """Toggle play/pause on given player.
 
         - player_id: player_id of the player to handle the command.
         """
+        # thin wrapper: return the command coroutine directly instead of awaiting it here
         player = self._get_player_with_redirect(player_id)
         if player.state == PlayerState.PLAYING:
-            await self.cmd_pause(player.player_id)
-        else:
-            await self.cmd_play(player.player_id)
+            return self.cmd_pause(player.player_id)
+        return self.cmd_play(player.player_id)
 
     @api_command("players/cmd/seek")
     async def cmd_seek(self, player_id: str, position: int) -> None:
@@ -302,7 +306,7 @@ class PlayerController(CoreController):
         if PlayerFeature.SEEK not in player.supported_features:
             msg = f"Player {player.display_name} does not support seeking"
             raise UnsupportedFeaturedException(msg)
-        player_prov = self.get_player_provider(player.player_id)
+        player_prov = self._get_provider_for_player(player)
         await player_prov.cmd_seek(player.player_id, position)
 
     @api_command("players/cmd/next")
@@ -320,7 +324,7 @@ class PlayerController(CoreController):
             # player has some other source active and native next/previous support
             active_source = next((x for x in player.source_list if x.id == active_source_id), None)
             if active_source and active_source.can_next_previous:
-                player_provider = self.get_player_provider(player.player_id)
+                player_provider = self._get_provider_for_player(player)
                 await player_provider.cmd_next(player.player_id)
                 return
             msg = "This action is (currently) unavailable for this source."
@@ -343,7 +347,7 @@ class PlayerController(CoreController):
             # player has some other source active and native next/previous support
             active_source = next((x for x in player.source_list if x.id == active_source_id), None)
             if active_source and active_source.can_next_previous:
-                player_provider = self.get_player_provider(player.player_id)
+                player_provider = self._get_provider_for_player(player)
                 await player_provider.cmd_previous(player.player_id)
                 return
             msg = "This action is (currently) unavailable for this source."
@@ -395,7 +399,7 @@ class PlayerController(CoreController):
             )
         if player.power_control == PLAYER_CONTROL_NATIVE:
             # player supports power command natively: forward to player provider
-            player_provider = self.get_player_provider(player_id)
+            player_provider = self._get_provider_for_player(player)
             async with self._player_throttlers[player_id]:
                 await player_provider.cmd_power(player_id, powered)
         elif player.power_control == PLAYER_CONTROL_FAKE:
@@ -460,7 +464,7 @@ class PlayerController(CoreController):
             )
         if player.volume_control == PLAYER_CONTROL_NATIVE:
             # player supports volume command natively: forward to player provider
-            player_provider = self.get_player_provider(player_id)
+            player_provider = self._get_provider_for_player(player)
             async with self._player_throttlers[player_id]:
                 await player_provider.cmd_volume_set(player_id, volume_level)
         else:
@@ -490,7 +494,7 @@ class PlayerController(CoreController):
             step_size = 2
         else:
             step_size = 5
-        new_volume = min(100, self._players[player_id].volume_level + step_size)
+        new_volume = min(100, player.volume_level + step_size)
         await self.cmd_volume_set(player_id, new_volume)
 
     @api_command("players/cmd/volume_down")
@@ -508,7 +512,7 @@ class PlayerController(CoreController):
             step_size = 2
         else:
             step_size = 5
-        new_volume = max(0, self._players[player_id].volume_level - step_size)
+        new_volume = max(0, player.volume_level - step_size)
         await self.cmd_volume_set(player_id, new_volume)
 
     @api_command("players/cmd/group_volume")
@@ -593,7 +597,7 @@ class PlayerController(CoreController):
             )
         if player.mute_control == PLAYER_CONTROL_NATIVE:
             # player supports mute command natively: forward to player provider
-            player_provider = self.get_player_provider(player_id)
+            player_provider = self._get_provider_for_player(player)
             async with self._player_throttlers[player_id]:
                 await player_provider.cmd_volume_mute(player_id, muted)
         elif player.power_control == PLAYER_CONTROL_FAKE:
@@ -708,7 +712,7 @@ class PlayerController(CoreController):
         # power on the player if needed
         if player.powered is False and player.power_control != PLAYER_CONTROL_NONE:
             await self.cmd_power(player.player_id, True)
-        player_prov = self.get_player_provider(player.player_id)
+        player_prov = self._get_provider_for_player(player)
         await player_prov.play_media(
             player_id=player.player_id,
             media=media,
@@ -908,7 +912,7 @@ class PlayerController(CoreController):
         player.active_source = None
 
         # forward command to the player provider
-        if player_provider := self.get_player_provider(player_id):
+        if player_provider := self._get_provider_for_player(player):
             await player_provider.cmd_ungroup(player_id)
         # if the command succeeded we optimistically reset the sync state
         # this is to prevent race conditions and to update the UI as fast as possible
@@ -999,6 +1003,8 @@ class PlayerController(CoreController):
         if cleanup_config:
             self.mass.config.remove(f"players/{player_id}")
         self._prev_states.pop(player_id, None)
+        self._player_throttlers.pop(player_id, None)
+        self._player_locks.pop(player_id, None)
         self.mass.signal_event(EventType.PLAYER_REMOVED, player_id)
 
     def update(  # noqa: PLR0915
@@ -1007,48 +1013,48 @@ class PlayerController(CoreController):
         """Update player state."""
         if self.mass.closing:
             return
-        if player_id not in self._players:
+        if (player := self._players.get(player_id)) is None:
             return
-        player = self._players[player_id]
         prev_state = self._prev_states.get(player_id, {})
         player.active_source = self._get_active_source(player)
         # set player sources
         self._set_player_sources(player)
         # prefer any overridden name from config
         player.display_name = (
-            self.mass.config.get_raw_player_config_value(player.player_id, "name")
+            self.mass.config.get_raw_player_config_value(player_id, "name")
             or player.name
             # use prev value (e.g. some fallback)
             or player.display_name
         )
         # handle player controls
-        if player.power_control == PLAYER_CONTROL_NONE:
+        controls = self._controls
+        power_control = player.power_control
+        if power_control == PLAYER_CONTROL_NONE:
             player.powered = None
-        elif player.power_control == PLAYER_CONTROL_FAKE:
+        elif power_control == PLAYER_CONTROL_FAKE:
             player.powered = False if player.powered is None else player.powered
-        elif player.power_control != PLAYER_CONTROL_NATIVE:
-            if player_control := self._controls.get(player.power_control):
+        elif power_control != PLAYER_CONTROL_NATIVE:
+            if player_control := controls.get(power_control):
                 player.powered = player_control.power_state
-        if player.volume_control == PLAYER_CONTROL_NONE:
+        volume_control = player.volume_control
+        if volume_control == PLAYER_CONTROL_NONE:
             player.volume_level = None
-        elif player.volume_control != PLAYER_CONTROL_NATIVE:
-            if player_control := self._controls.get(player.volume_control):
+        elif volume_control != PLAYER_CONTROL_NATIVE:
+            if player_control := controls.get(volume_control):
                 player.volume_level = player_control.volume_level
-        if player.mute_control == PLAYER_CONTROL_NONE:
+        mute_control = player.mute_control
+        if mute_control == PLAYER_CONTROL_NONE:
             player.volume_muted = None
-        elif player.mute_control not in (PLAYER_CONTROL_NATIVE, PLAYER_CONTROL_FAKE):
-            if player_control := self._controls.get(player.mute_control):
+        elif mute_control not in (PLAYER_CONTROL_NATIVE, PLAYER_CONTROL_FAKE):
+            if player_control := controls.get(mute_control):
                 player.volume_muted = player_control.volume_muted
         # correct group_members if needed
-        if player.group_childs == [player.player_id]:
-            player.group_childs.clear()
-        elif (
-            player.group_childs
-            and player.player_id not in player.group_childs
-            and player.type == PlayerType.PLAYER
-        ):
-            player.group_childs.set([player.player_id, *player.group_childs])
-        if player.active_group and player.active_group == player.player_id:
+        group_childs = player.group_childs
+        if group_childs == [player_id]:
+            group_childs.clear()
+        elif group_childs and player_id not in group_childs and player.type == PlayerType.PLAYER:
+            group_childs.set([player_id, *group_childs])
+        if player.active_group and player.active_group == player_id:
             player.active_group = None
         # Auto correct player state if player is synced (or group child)
         # This is because some players/providers do not accurately update this info
@@ -1067,15 +1073,11 @@ class PlayerController(CoreController):
             player.available = False
 
         # basic throttle: do not send state changed events if player did not actually change
-        new_state = self._players[player_id].to_dict()
+        new_state = player.to_dict()
         changed_values = get_changed_values(
             prev_state,
             new_state,
-            ignore_keys=[
-                "elapsed_time_last_updated",
-                "seq_no",
-                "last_poll",
-            ],
+            ignore_keys=IGNORE_CHANGED_KEYS,
         )
         self._prev_states[player_id] = new_state
 
@@ -1090,7 +1092,7 @@ class PlayerController(CoreController):
             # nothing changed
             return
 
-        if changed_values.keys() == {"elapsed_time"} and not force_update:
+        if len(changed_values) == 1 and "elapsed_time" in changed_values and not force_update:
             # ignore elapsed_time only changes
             return
 
@@ -1208,9 +1210,7 @@ class PlayerController(CoreController):
 
     def get_player_provider(self, player_id: str) -> PlayerProvider:
         """Return PlayerProvider for given player."""
-        player = self._players[player_id]
-        player_provider = self.mass.get_provider(player.provider)
-        return cast(PlayerProvider, player_provider)
+        return self._get_provider_for_player(self._players[player_id])
 
     def get_announcement_volume(self, player_id: str, volume_override: int | None) -> int | None:
         """Get the (player specific) volume for a announcement."""
@@ -1362,6 +1362,10 @@ class PlayerController(CoreController):
             # this will restart ffmpeg with the new settings
             self.mass.call_later(0, self.mass.player_queues.resume, player.active_source)
 
+    def _get_provider_for_player(self, player: Player) -> PlayerProvider:
+        """Return PlayerProvider for an already resolved player (saves a player lookup)."""
+        return cast(PlayerProvider, self.mass.get_provider(player.provider))
+
     def _get_player_with_redirect(self, player_id: str) -> Player:
         """Get player with check if playback related command should be redirected."""
         player = self.get(player_id, True)
@@ -1625,7 +1629,7 @@ class PlayerController(CoreController):
                 if (self.mass.loop.time() - player.last_poll) < player.poll_interval:
                     continue
                 player.last_poll = self.mass.loop.time()
-                if player_prov := self.get_player_provider(player_id):
+                if player_prov := self._get_provider_for_player(player):
                     try:
                         await player_prov.poll_player(player_id)
                     except PlayerUnavailableError:
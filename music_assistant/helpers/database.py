@@ -187,6 +187,25 @@ class DatabaseConnection:
         await self._db.commit()
         return row_id[0]
 
+    async def insert_many(
+        self,
+        table: str,
+        values: list[dict[str, Any]],
+        allow_replace: bool = False,
+    ) -> None:
+        """Insert multiple rows (with the same keys) in given table in a single transaction."""
+        if values:
+            keys = tuple(values[0].keys())
+            if allow_replace:
+                sql_query = f"INSERT OR REPLACE INTO {table}({','.join(keys)})"
+            else:
+                sql_query = f"INSERT INTO {table}({','.join(keys)})"
+            sql_query += f" VALUES ({','.join(f':{x}' for x in keys)})"
+            async with debug_query(sql_query):
+                await self._db.executemany(sql_query, values)
+        # always commit, this also commits any (uncommitted) statements executed before
+        await self._db.commit()
+
     async def insert_or_replace(self, table: str, values: dict[str, Any]) -> Mapping:
         """Insert or replace data in given table."""
         return await self.insert(table=table, values=values, allow_replace=True)
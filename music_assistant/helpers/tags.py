@@ -16,6 +16,11 @@ from typing import Any
 import mutagen
 from music_assistant_models.enums import AlbumType
 from music_assistant_models.errors import InvalidDataError
+from mutagen.aiff import AIFF
+from mutagen.dsdiff import DSDIFF
+from mutagen.dsf import DSF
+from mutagen.mp3 import MP3
+from mutagen.wave import WAVE
 
 from music_assistant.constants import MASS_LOGGER_NAME, UNKNOWN_ARTIST
 from music_assistant.helpers.json import json_loads
@@ -31,6 +36,25 @@ LOGGER = logging.getLogger(f"{MASS_LOGGER_NAME}.tags")
 # artists actually containing a slash in the name, such as AC/DC
 TAG_SPLITTER = ";"
 
+# we only extract (extra) ID3 frames with mutagen so only consider the (scanned) file types
+# we read an ID3 tag from, this prevents mutagen from fully loading all other files
+# (including any embedded cover art) only to find nothing of interest.
+MUTAGEN_ID3_FILE_TYPES = [MP3, AIFF, WAVE, DSF, DSDIFF]
+# the extensions matched (scored) by the mutagen types above
+MUTAGEN_ID3_EXTENSIONS = (
+    ".mp3",
+    ".mp2",
+    ".mp1",
+    ".mpg",
+    ".mpeg",
+    ".aiff",
+    ".aif",
+    ".aifc",
+    ".wav",
+    ".dsf",
+    ".dff",
+)
+
 
 def clean_tuple(values: Iterable[str]) -> tuple:
     """Return a tuple with all empty values removed."""
@@ -496,10 +520,13 @@ def parse_tags_mutagen(input_file: str) -> dict[str, Any]:
     NOT Async friendly.
     """
     result = {}
+    if not input_file.lower().endswith(MUTAGEN_ID3_EXTENSIONS):
+        # skip files that can not carry an ID3 tag without even opening them
+        return result
     try:
         # TODO: extend with more tags and file types!
-        tags = mutagen.File(input_file)
-        if tags is None:
+        tags = mutagen.File(input_file, options=MUTAGEN_ID3_FILE_TYPES)
+        if tags is None or tags.tags is None:
             return result
         tags = dict(tags.tags)
         # ID3 tags
@@ -543,7 +570,7 @@ def parse_tags_mutagen(input_file: str) -> dict[str, Any]:
         del tags
         return result
     except Exception as err:
-        LOGGER.debug(f"Error parsing mutagen tags for {input_file}: {err}")
+        LOGGER.debug("Error parsing mutagen tags for %s: %s", input_file, err)
         return result
 
 
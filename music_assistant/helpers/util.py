@@ -12,7 +12,7 @@ import socket
 import urllib.error
 import urllib.parse
 import urllib.request
-from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from collections.abc import AsyncGenerator, Awaitable, Callable, Container, Coroutine
 from contextlib import suppress
 from functools import lru_cache
 from importlib.metadata import PackageNotFoundError
@@ -298,7 +298,7 @@ def get_folder_size(folderpath: str) -> float:
 def get_changed_keys(
     dict1: dict[str, Any],
     dict2: dict[str, Any],
-    ignore_keys: list[str] | None = None,
+    ignore_keys: Container[str] | None = None,
     recursive: bool = False,
 ) -> set[str]:
     """Compare 2 dicts and return set of changed keys."""
@@ -308,7 +308,7 @@ def get_changed_keys(
 def get_changed_values(
     dict1: dict[str, Any],
     dict2: dict[str, Any],
-    ignore_keys: list[str] | None = None,
+    ignore_keys: Container[str] | None = None,
     recursive: bool = False,
 ) -> dict[str, tuple[Any, Any]]:
     """
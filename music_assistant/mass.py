@@ -362,19 +362,21 @@ class MusicAssistant:
                 "Non-Async operation detected: This method may only be called from the eventloop."
             )
 
-        if asyncio.iscoroutinefunction(target):
+        if asyncio.iscoroutine(target):
+            # coroutine (most common case, checked first as it is the cheapest check)
+            task = self.loop.create_task(target)
+        elif asyncio.iscoroutinefunction(target):
             # coroutine function
             task = self.loop.create_task(target(*args, **kwargs))
-        elif asyncio.iscoroutine(target):
-            # coroutine
-            task = self.loop.create_task(target)
         elif callable(target):
             raise RuntimeError("Function is not a coroutine or coroutine function")
         else:
             raise RuntimeError("Target is missing")
 
         if task_id is None:
-            task_id = uuid4().hex
+            # the task object stays alive until its done callback ran,
+            # so its id is unique among the tracked tasks (and a lot cheaper than a uuid)
+            task_id = f"task_{id(task)}"
 
         def task_done_callback(_task: asyncio.Task[Any]) -> None:
             self._tracked_tasks.pop(task_id, None)
@@ -32,6 +32,7 @@ from .provider import Provider
 if TYPE_CHECKING:
     from music_assistant_models.config_entries import PlayerConfig
     from music_assistant_models.player import Player, PlayerMedia
+    from music_assistant_models.player_control import PlayerControl
 
 # ruff: noqa: ARG001, ARG002
 
@@ -274,10 +275,17 @@ class PlayerProvider(Provider):
         self, player: Player | None
     ) -> tuple[ConfigEntry, ...]:
         """Create config entries for player controls."""
-        all_controls = self.mass.players.player_controls()
-        power_controls = [x for x in all_controls if x.supports_power]
-        volume_controls = [x for x in all_controls if x.supports_volume]
-        mute_controls = [x for x in all_controls if x.supports_mute]
+        # bucket the controls per type in a single pass
+        power_controls: list[PlayerControl] = []
+        volume_controls: list[PlayerControl] = []
+        mute_controls: list[PlayerControl] = []
+        for control in self.mass.players.player_controls():
+            if control.supports_power:
+                power_controls.append(control)
+            if control.supports_volume:
+                volume_controls.append(control)
+            if control.supports_mute:
+                mute_controls.append(control)
         # work out player supported features
         supports_power = PlayerFeature.POWER in player.supported_features if player else False
         supports_volume = PlayerFeature.VOLUME_SET in player.supported_features if player else False
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
+import time
 from collections.abc import AsyncGenerator
-from logging import getLevelName
 from typing import TYPE_CHECKING, cast
-from uuid import uuid4
 
 import audible
 from music_assistant_models.config_entries import (
@@ -19,13 +19,18 @@ from music_assistant_models.config_entries import (
 from music_assistant_models.enums import ConfigEntryType, EventType, MediaType, ProviderFeature
 from music_assistant_models.errors import LoginFailed
 
+from music_assistant.controllers.cache import MemoryCache
 from music_assistant.models.music_provider import MusicProvider
 from music_assistant.providers.audible.audible_helper import (
     AudibleHelper,
     audible_custom_login,
     audible_get_auth_info,
-    check_file_exists,
+    get_auth_file_name,
+    invalidate_authenticator,
+    load_authenticator,
     remove_file,
+    remove_stale_auth_files,
+    save_authenticator,
 )
 
 if TYPE_CHECKING:
@@ -48,6 +53,37 @@ CONF_SERIAL = "serial"
 CONF_LOGIN_URL = "login_url"
 CONF_LOCALE = "locale"
 
+# refresh the access token this many seconds before it expires (but never sooner than the min)
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_MIN_DELAY = 60
+
+# seconds to keep (full) audiobook details around for repeated lookups
+AUDIOBOOK_CACHE_TTL = 300
+# max number of (full) audiobook details to keep around
+AUDIOBOOK_CACHE_MAX_ITEMS = 50
+
+# static parts of the config entries, created once instead of on every (re)render of the form
+LOCALE_OPTIONS = [
+    ConfigValueOption("US and all other countries not listed", "us"),
+    ConfigValueOption("Canada", "ca"),
+    ConfigValueOption("UK and Ireland", "uk"),
+    ConfigValueOption("Australia and New Zealand", "au"),
+    ConfigValueOption("France, Belgium, Switzerland", "fr"),
+    ConfigValueOption("Germany, Austria, Switzerland", "de"),
+    ConfigValueOption("Japan", "jp"),
+    ConfigValueOption("Italy", "it"),
+    ConfigValueOption("India", "in"),
+    ConfigValueOption("Spain", "es"),
+    ConfigValueOption("Brazil", "br"),
+]
+CONF_ENTRY_ACTION_AUTH = ConfigEntry(
+    key=CONF_ACTION_AUTH,
+    type=ConfigEntryType.ACTION,
+    label="(Re)Authenticate with Audible",
+    description="This button will redirect you to Audible to authenticate.",
+    action=CONF_ACTION_AUTH,
+)
+
 
 async def setup(
     mass: MusicAssistant, manifest: ProviderManifest, config: ProviderConfig
@@ -77,10 +113,9 @@ async def get_config_entries(
 
     # Check if auth file exists and is valid
     auth_required = True
-    if auth_file and await check_file_exists(auth_file):
+    if auth_file:
         try:
-            auth = await asyncio.to_thread(audible.Authenticator.from_file, auth_file)
-            auth_required = False
+            auth_required = await load_authenticator(auth_file) is None
         except Exception:
             auth_required = True
     label_text = ""
@@ -101,8 +136,9 @@ async def get_config_entries(
         )
 
     if action == CONF_ACTION_AUTH:
-        if auth_file and await check_file_exists(auth_file):
+        if auth_file:
             await remove_file(auth_file)
+            invalidate_authenticator(auth_file)
             values[CONF_AUTH_FILE] = None
             auth_file = ""
 
@@ -121,8 +157,16 @@ async def get_config_entries(
         storage_path = mass.storage_path
 
         auth = await audible_custom_login(code_verifier, post_login_url, serial, locale)
-        auth_file_path = os.path.join(storage_path, f"audible_auth_{uuid4().hex}.json")
-        await asyncio.to_thread(auth.to_file, auth_file_path)
+        auth_file_path = os.path.join(storage_path, get_auth_file_name(locale, serial))
+        await save_authenticator(auth, auth_file_path)
+        # cleanup auth files of previous authentications no provider is referring to anymore
+        keep = {auth_file_path}
+        for prov_conf in await mass.config.get_provider_configs(provider_domain="audible"):
+            if prov_auth_file := mass.config.get_raw_provider_config_value(
+                prov_conf.instance_id, CONF_AUTH_FILE
+            ):
+                keep.add(str(prov_auth_file))
+        await remove_stale_auth_files(storage_path, keep)
         values[CONF_AUTH_FILE] = auth_file_path
         auth_required = False
 
@@ -139,28 +183,10 @@ async def get_config_entries(
             hidden=not auth_required,
             required=True,
             value=locale,
-            options=[
-                ConfigValueOption("US and all other countries not listed", "us"),
-                ConfigValueOption("Canada", "ca"),
-                ConfigValueOption("UK and Ireland", "uk"),
-                ConfigValueOption("Australia and New Zealand", "au"),
-                ConfigValueOption("France, Belgium, Switzerland", "fr"),
-                ConfigValueOption("Germany, Austria, Switzerland", "de"),
-                ConfigValueOption("Japan", "jp"),
-                ConfigValueOption("Italy", "it"),
-                ConfigValueOption("India", "in"),
-                ConfigValueOption("Spain", "es"),
-                ConfigValueOption("Brazil", "br"),
-            ],
+            options=LOCALE_OPTIONS,
             default_value="us",
         ),
-        ConfigEntry(
-            key=CONF_ACTION_AUTH,
-            type=ConfigEntryType.ACTION,
-            label="(Re)Authenticate with Audible",
-            description="This button will redirect you to Audible to authenticate.",
-            action=CONF_ACTION_AUTH,
-        ),
+        CONF_ENTRY_ACTION_AUTH,
         ConfigEntry(
             key=CONF_POST_LOGIN_URL,
             type=ConfigEntryType.STRING,
@@ -223,22 +249,30 @@ class Audibleprovider(MusicProvider):
         self.locale = cast(str, self.config.get_value(CONF_LOCALE) or "us")
         self.auth_file = cast(str, self.config.get_value(CONF_AUTH_FILE))
         self._client: audible.AsyncClient | None = None
-        audible.log_helper.set_level(getLevelName(self.logger.level))
+        self._token_refresh_timer: asyncio.TimerHandle | None = None
+        self._audiobook_cache = MemoryCache(AUDIOBOOK_CACHE_MAX_ITEMS)
+        # the audible logger is library global, only (re)configure it when the level changes
+        if logging.getLogger("audible").level != self.logger.level:
+            audible.log_helper.set_level(logging.getLevelName(self.logger.level))
 
     async def handle_async_init(self) -> None:
         """Handle asynchronous initialization of the provider."""
         await self._login()
+        self._schedule_token_refresh()
 
     async def _login(self) -> None:
         """Authenticate with Audible using the saved authentication file."""
+        if not self.auth_file or (auth := await load_authenticator(self.auth_file)) is None:
+            raise LoginFailed(
+                "Missing or invalid Audible authentication file, please re-authenticate."
+            )
         try:
-            auth = await asyncio.to_thread(audible.Authenticator.from_file, self.auth_file)
-
             if auth.access_token_expired:
                 await asyncio.to_thread(auth.refresh_access_token)
-                await asyncio.to_thread(auth.to_file, self.auth_file)
+                await save_authenticator(auth, self.auth_file)
 
-            self._client = audible.AsyncClient(auth)
+            # creating the (httpx) client loads the ssl context from disk, which is blocking I/O
+            self._client = await asyncio.to_thread(audible.AsyncClient, auth)
 
             self.helper = AudibleHelper(
                 mass=self.mass,
@@ -250,9 +284,32 @@ class Audibleprovider(MusicProvider):
             self.logger.info("Successfully authenticated with Audible.")
 
         except Exception as e:
-            self.logger.error(f"Failed to authenticate with Audible: {e}")
+            self.logger.error("Failed to authenticate with Audible: %s", e)
             raise LoginFailed("Failed to authenticate with Audible.")
 
+    def _schedule_token_refresh(self) -> None:
+        """Schedule a refresh of the access token shortly before it expires."""
+        if self._client is None or self._client.auth.expires is None:
+            return
+        expires_in = self._client.auth.access_token_expires.total_seconds()
+        self._token_refresh_timer = self.mass.call_later(
+            max(TOKEN_REFRESH_MIN_DELAY, expires_in - TOKEN_REFRESH_MARGIN),
+            self._refresh_access_token,
+            task_id=f"audible_token_refresh_{self.instance_id}",
+        )
+
+    async def _refresh_access_token(self) -> None:
+        """Refresh the access token in the background, so requests never wait for it."""
+        if self._client is None:
+            return
+        auth = self._client.auth
+        try:
+            await asyncio.to_thread(auth.refresh_access_token, True)
+            await save_authenticator(auth, self.auth_file)
+        except Exception as err:
+            self.logger.warning("Failed to refresh Audible access token: %s", err)
+        self._schedule_token_refresh()
+
     @property
     def supported_features(self) -> set[ProviderFeature]:
         """Return the features supported by this Provider."""
@@ -270,9 +327,15 @@ class Audibleprovider(MusicProvider):
 
     async def get_audiobook(self, prov_audiobook_id: str) -> Audiobook:
         """Get full audiobook details by id."""
+        if prov_audiobook_id in self._audiobook_cache:
+            timestamp, cached_audiobook = self._audiobook_cache[prov_audiobook_id]
+            if time.monotonic() - timestamp < AUDIOBOOK_CACHE_TTL:
+                return cached_audiobook
+            del self._audiobook_cache[prov_audiobook_id]
         audiobook = await self.helper.get_audiobook(asin=prov_audiobook_id, use_cache=False)
         if audiobook is None:
             raise ValueError(f"Audiobook with id {prov_audiobook_id} not found")
+        self._audiobook_cache[prov_audiobook_id] = (time.monotonic(), audiobook)
         return audiobook
 
     async def get_stream_details(self, item_id: str, media_type: MediaType) -> StreamDetails:
@@ -306,6 +369,8 @@ class Audibleprovider(MusicProvider):
 
         media_item is the full media item details of the played/playing track.
         """
+        # the resume position is part of the audiobook details, so drop the cached copy
+        self._audiobook_cache.pop(prov_item_id, None)
         await self.helper.set_last_position(prov_item_id, position)
 
     async def unload(self, is_removed: bool = False) -> None:
@@ -315,5 +380,12 @@ class Audibleprovider(MusicProvider):
         Called when provider is deregistered (e.g. MA exiting or config reloading).
         is_removed will be set to True when the provider is removed from the configuration.
         """
+        if self._token_refresh_timer is not None:
+            self._token_refresh_timer.cancel()
+            self._token_refresh_timer = None
         if is_removed:
             await self.helper.deregister()
+        # release the connection pool of the (httpx) client
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
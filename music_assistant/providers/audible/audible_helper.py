@@ -6,15 +6,22 @@ import asyncio
 import hashlib
 import html
 import json
+import math
 import os
 import re
+import stat
+from collections import deque
 from collections.abc import AsyncGenerator
+from contextlib import suppress
+from html.parser import HTMLParser
 from os import PathLike
+from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 import audible
 import audible.register
+from aiofiles.os import wrap
 from audible import AsyncClient
 from music_assistant_models.enums import ContentType, ImageType, MediaType, StreamType
 from music_assistant_models.errors import LoginFailed
@@ -28,12 +35,37 @@ from music_assistant_models.media_items import (
 )
 from music_assistant_models.streamdetails import StreamDetails
 
+from music_assistant.helpers.throttle_retry import Throttler
 from music_assistant.mass import MusicAssistant
 
 CACHE_DOMAIN = "audible"
-CACHE_CATEGORY_API = 0
 CACHE_CATEGORY_AUDIOBOOK = 1
 CACHE_CATEGORY_CHAPTERS = 2
+CACHE_CATEGORY_AUDIOBOOK_PARSED = 3
+# Audible accepts (much) larger pages than 50, fewer pages means fewer round-trips
+LIBRARY_PAGE_SIZE = 200
+LIBRARY_PAGE_CONCURRENCY = 4
+# max number of asins per lastpositions request, keeps the request url within limits
+LAST_POSITIONS_BATCH_SIZE = 50
+LIBRARY_RESPONSE_GROUPS = (
+    "contributors,media,product_attrs,product_desc,product_details,product_extended_attrs"
+)
+AUDIOBOOK_RESPONSE_GROUPS = (
+    "contributors,media,price,product_attrs,product_desc,product_details,"
+    "product_extended_attrs,is_finished"
+)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+remove = wrap(os.remove)
+
+AUTH_FILE_REQUIRED_KEYS = ("adp_token", "device_private_key", "customer_info", "locale_code")
+
+AUTH_FILE_PREFIX = "audible_auth_"
+_AUTH_FILES_LOCK = asyncio.Lock()
+# loaded authenticators, keyed by auth file path: (mtime_ns of the file, authenticator)
+_AUTH_CACHE: dict[str, tuple[int, audible.Authenticator]] = {}
+# digest of the last known contents of each auth file, used to skip unchanged rewrites
+_AUTH_FILE_DIGESTS: dict[str, bytes] = {}
 
 
 class AudibleHelper:
@@ -51,53 +83,138 @@ class AudibleHelper:
         self.client = client
         self.provider_domain = provider_domain
         self.provider_instance = provider_instance
+        # Audible blocks clients that hammer the API, so keep a sustainable request rate.
+        # The (background) library sync has its own limiter so it can never stall
+        # user facing requests, such as starting playback, for the rest of the period.
+        self.throttler = Throttler(rate_limit=20, period=60)
+        self.sync_throttler = Throttler(rate_limit=80, period=60)
+        self._inflight_chapters: dict[str, asyncio.Task[list[Any]]] = {}
 
     async def get_library(self) -> AsyncGenerator[Audiobook, None]:
         """Fetch the user's library with pagination."""
-        response_groups = [
-            "contributors",
-            "media",
-            "product_attrs",
-            "product_desc",
-            "product_details",
-            "product_extended_attrs",
-        ]
-
-        page = 1
-        page_size = 50
-
-        while True:
-            library = await self._call_api(
-                "library",
-                use_cache=False,
-                response_groups=",".join(response_groups),
-                page=page,
-                num_results=page_size,
+        page_size = LIBRARY_PAGE_SIZE
+
+        def fetch_page(page: int) -> asyncio.Task[Any]:
+            return asyncio.create_task(
+                self._call_api(
+                    "library",
+                    throttler=self.sync_throttler,
+                    response_groups=LIBRARY_RESPONSE_GROUPS,
+                    page=page,
+                    num_results=page_size,
+                )
             )
 
-            items = library.get("items", [])
-            if not items:
-                break
-
-            for audiobook_data in items:
-                asin = audiobook_data.get("asin")
-                cached_book = await self.mass.cache.get(
-                    key=asin, base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_AUDIOBOOK, default=None
+        # the first page tells us the total number of items (and thus pages)
+        library = await fetch_page(1)
+        num_pages: int | None = None
+        if (total_items := library.get("total_results")) is not None:
+            num_pages = math.ceil(total_items / page_size)
+        # prefetch a limited window of pages while processing them in order,
+        # so only a few pages are held in memory at any time
+        page_tasks: deque[asyncio.Task[Any]] = deque()
+        if num_pages is not None:
+            page_tasks.extend(
+                fetch_page(page) for page in range(2, min(num_pages, LIBRARY_PAGE_CONCURRENCY) + 1)
+            )
+        next_page = len(page_tasks) + 2
+        try:
+            while True:
+                items = library.get("items", [])
+                if not items:
+                    break
+
+                # fetch the resume positions of the whole page in a few batched requests
+                positions = await self.get_last_positions(
+                    [asin for item in items if (asin := item.get("asin"))]
                 )
-
-                if cached_book is not None:
-                    album = await self._parse_audiobook(cached_book)
-                    yield album
-                else:
-                    album = await self._parse_audiobook(audiobook_data)
+                # a changed library item (title, authors, cover, ...) invalidates the parsed book
+                checksums = [_get_checksum(item) for item in items]
+                parsed_books = await asyncio.gather(
+                    *(
+                        self.mass.cache.get(
+                            key=item.get("asin"),
+                            checksum=checksum,
+                            base_key=CACHE_DOMAIN,
+                            category=CACHE_CATEGORY_AUDIOBOOK_PARSED,
+                            default=None,
+                        )
+                        for item, checksum in zip(items, checksums, strict=True)
+                    )
+                )
+                # prefetch the chapters of all books on this page that need (re)parsing
+                to_parse = [
+                    item.get("asin")
+                    for item, parsed_book in zip(items, parsed_books, strict=True)
+                    if not parsed_book
+                ]
+                chapter_results = dict(
+                    zip(
+                        to_parse,
+                        await asyncio.gather(
+                            *(
+                                self._get_chapters(asin=asin, throttler=self.sync_throttler)
+                                for asin in to_parse
+                            ),
+                            return_exceptions=True,
+                        ),
+                        strict=True,
+                    )
+                )
+                for audiobook_data, parsed_book, checksum in zip(
+                    items, parsed_books, checksums, strict=True
+                ):
+                    asin = audiobook_data.get("asin")
+                    resume_position_ms = positions.get(asin, 0)
+                    if parsed_book:
+                        # only the resume position is volatile, the rest can be reused as-is
+                        album = Audiobook.from_dict(parsed_book)
+                        album.resume_position_ms = resume_position_ms
+                        yield album
+                        continue
+                    cached_book = await self.mass.cache.get(
+                        key=asin,
+                        base_key=CACHE_DOMAIN,
+                        category=CACHE_CATEGORY_AUDIOBOOK,
+                        default=None,
+                    )
+                    chapters_result = chapter_results[asin]
+                    album = await self._parse_audiobook(
+                        audiobook_data if cached_book is None else cached_book,
+                        resume_position_ms=resume_position_ms,
+                        chapters_data=(
+                            [] if isinstance(chapters_result, BaseException) else chapters_result
+                        ),
+                    )
+                    if album.metadata.chapters:
+                        # don't keep a book around that is incomplete due to a failed lookup
+                        await self.mass.cache.set(
+                            key=asin,
+                            base_key=CACHE_DOMAIN,
+                            category=CACHE_CATEGORY_AUDIOBOOK_PARSED,
+                            data=album.to_dict(),
+                            checksum=checksum,
+                        )
                     yield album
 
-            # Check if we've reached the end
-            total_items = library.get("total_results", 0)
-            if page * page_size >= total_items:
-                break
-
-            page += 1
+                if num_pages is None:
+                    # total is unknown, fetch sequentially until a partial page is returned
+                    if len(items) < page_size:
+                        break
+                    library = await fetch_page(next_page)
+                    next_page += 1
+                    continue
+                if not page_tasks:
+                    break
+                if next_page <= num_pages:
+                    page_tasks.append(fetch_page(next_page))
+                    next_page += 1
+                library = await page_tasks.popleft()
+        finally:
+            for page_task in page_tasks:
+                page_task.cancel()
+            # retrieve the results so no pending task or unretrieved exception is reported
+            await asyncio.gather(*page_tasks, return_exceptions=True)
 
     async def get_audiobook(self, asin: str, use_cache: bool = True) -> Audiobook | None:
         """Fetch the audiobook by asin."""
@@ -109,10 +226,7 @@ class AudibleHelper:
                 return await self._parse_audiobook(cached_book)
         response = await self._call_api(
             f"library/{asin}",
-            response_groups="""
-                contributors, media, price, product_attrs, product_desc, product_details,
-                product_extended_attrs,is_finished
-                """,
+            response_groups=AUDIOBOOK_RESPONSE_GROUPS,
         )
 
         if response is None:
@@ -131,21 +245,22 @@ class AudibleHelper:
 
         duration = sum(chapter["length_ms"] for chapter in chapters) / 1000
 
-        playback_info = await self.client.post(
-            f"content/{asin}/licenserequest",
-            body={
-                "quality": "High",
-                "response_groups": "content_reference,certificate",
-                "consumption_type": "Streaming",
-                "supported_media_features": {
-                    "codecs": ["mp4a.40.2", "mp4a.40.42"],
-                    "drm_types": [
-                        "Hls",
-                    ],
+        async with self.throttler:
+            playback_info = await self.client.post(
+                f"content/{asin}/licenserequest",
+                body={
+                    "quality": "High",
+                    "response_groups": "content_reference,certificate",
+                    "consumption_type": "Streaming",
+                    "supported_media_features": {
+                        "codecs": ["mp4a.40.2", "mp4a.40.42"],
+                        "drm_types": [
+                            "Hls",
+                        ],
+                    },
+                    "spatial": False,
                 },
-                "spatial": False,
-            },
-        )
+            )
         size = (
             playback_info.get("content_license")
             .get("content_metadata")
@@ -169,13 +284,22 @@ class AudibleHelper:
             data={"acr": acr},
         )
 
-    async def _fetch_chapters(self, asin: str) -> Any:
+    async def _fetch_chapters(self, asin: str) -> list[Any]:
+        # coalesce concurrent lookups of the same asin (e.g. stream details and parsing)
+        if (task := self._inflight_chapters.get(asin)) is None:
+            task = asyncio.create_task(self._get_chapters(asin))
+            self._inflight_chapters[asin] = task
+            task.add_done_callback(lambda _: self._inflight_chapters.pop(asin, None))
+        return await asyncio.shield(task)
+
+    async def _get_chapters(self, asin: str, throttler: Throttler | None = None) -> list[Any]:
         chapters_data: list[Any] = await self.mass.cache.get(
             base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_CHAPTERS, key=asin, default=[]
         )
         if not chapters_data:
             response = await self._call_api(
                 f"content/{asin}/metadata",
+                throttler=throttler,
                 response_groups="chapter_info, always-returned, content_reference, content_url",
                 chapter_titles_type="Flat",
             )
@@ -197,37 +321,96 @@ class AudibleHelper:
             .get("position_ms", 0)
         )
 
+    async def get_last_positions(self, asins: list[str]) -> dict[str, int]:
+        """Fetch last positions of multiple asins in batches (during library sync)."""
+        positions: dict[str, int] = {}
+        for batch_positions in await asyncio.gather(
+            *(
+                self._get_last_positions_batch(asins[i : i + LAST_POSITIONS_BATCH_SIZE])
+                for i in range(0, len(asins), LAST_POSITIONS_BATCH_SIZE)
+            )
+        ):
+            positions.update(batch_positions)
+        return positions
+
+    async def _get_last_positions_batch(self, asins: list[str]) -> dict[str, int]:
+        try:
+            response = await self._call_api(
+                "annotations/lastpositions",
+                throttler=self.sync_throttler,
+                asins=",".join(asins),
+            )
+        except Exception:
+            # the resume position is not critical, don't fail the library sync on it
+            return {}
+        return {
+            annot["asin"]: int((annot.get("last_position_heard") or {}).get("position_ms", 0))
+            for annot in response.get("asin_last_position_heard_annots", [])
+            if annot.get("asin")
+        }
+
     async def set_last_position(self, asin: str, pos: int) -> Any:
         """Report last position."""
 
-    async def _call_api(self, path: str, **kwargs: Any) -> Any:
-        response = None
-        use_cache = False
-        params_str = json.dumps(kwargs, sort_keys=True)
-        params_hash = hashlib.md5(params_str.encode()).hexdigest()
-        cache_key_with_params = f"{path}:{params_hash}"
-        if use_cache:
-            response = await self.mass.cache.get(
-                key=cache_key_with_params, base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_API
-            )
-        if not response:
-            response = await self.client.get(path, **kwargs)
-            await self.mass.cache.set(
-                key=cache_key_with_params, base_key=CACHE_DOMAIN, data=response
-            )
-        return response
+    async def _call_api(
+        self, path: str, *, throttler: Throttler | None = None, **kwargs: Any
+    ) -> Any:
+        async with throttler or self.throttler:
+            return await self.client.get(path, **kwargs)
 
-    async def _parse_audiobook(self, audiobook_data: dict[str, Any]) -> Audiobook:
+    async def _parse_audiobook(
+        self,
+        audiobook_data: dict[str, Any],
+        resume_position_ms: int | None = None,
+        chapters_data: list[Any] | None = None,
+    ) -> Audiobook:
         asin = audiobook_data.get("asin", "")
         title = audiobook_data.get("title", "")
-        authors = []
-        narrators = []
-        for narrator in audiobook_data.get("narrators", []):
-            narrators.append(narrator.get("name"))
-        for author in audiobook_data.get("authors", []):
-            authors.append(author.get("name"))
-        chapters_data = await self._fetch_chapters(asin=asin)
-        duration = sum(chapter["length_ms"] for chapter in chapters_data) / 1000
+        authors = [
+            name for author in audiobook_data.get("authors") or () if (name := author.get("name"))
+        ]
+        narrators = [
+            name
+            for narrator in audiobook_data.get("narrators") or ()
+            if (name := narrator.get("name"))
+        ]
+        if chapters_data is None and resume_position_ms is None:
+            # chapters and resume position are independent lookups, fetch them concurrently
+            chapters_result, position_result = await asyncio.gather(
+                self._fetch_chapters(asin=asin),
+                self.get_last_postion(asin=asin),
+                return_exceptions=True,
+            )
+            chapters_data = [] if isinstance(chapters_result, BaseException) else chapters_result
+            resume_position_ms = (
+                0 if isinstance(position_result, BaseException) else position_result
+            )
+        elif chapters_data is None:
+            try:
+                chapters_data = await self._fetch_chapters(asin=asin)
+            except Exception:
+                chapters_data = []
+        elif resume_position_ms is None:
+            try:
+                resume_position_ms = await self.get_last_postion(asin=asin)
+            except Exception:
+                resume_position_ms = 0
+        # build the chapters and sum up the total duration in a single pass
+        chapters = []
+        total_ms = 0
+        for index, chapter_data in enumerate(chapters_data):
+            start = int(chapter_data.get("start_offset_sec", 0))
+            length_ms = int(chapter_data.get("length_ms", 0))
+            total_ms += length_ms
+            chapters.append(
+                MediaItemChapter(
+                    position=index,
+                    name=chapter_data.get("title"),
+                    start=start,
+                    end=start + length_ms / 1000,
+                )
+            )
+        duration = total_ms // 1000
         book = Audiobook(
             item_id=asin,
             provider=self.provider_instance,
@@ -254,36 +437,28 @@ class AudibleHelper:
         if reviews:
             book.metadata.review = _html_to_txt(reviews[0])
         book.metadata.genres = {
-            genre.replace("_", " ") for genre in audiobook_data.get("platinum_keywords", "")
+            genre.replace("_", " ") if "_" in genre else genre
+            for genre in audiobook_data.get("platinum_keywords") or ()
         }
-        book.metadata.images = UniqueList(
-            [
-                MediaItemImage(
-                    type=ImageType.THUMB,
-                    path=audiobook_data.get("product_images", {}).get("500"),
-                    provider=self.provider_instance,
-                    remotely_accessible=True,
-                ),
-                MediaItemImage(
-                    type=ImageType.CLEARART,
-                    path=audiobook_data.get("product_images", {}).get("500"),
-                    provider=self.provider_instance,
-                    remotely_accessible=True,
-                ),
-            ]
-        )
-
-        chapters = []
-        for index, chapter_data in enumerate(chapters_data):
-            start = int(chapter_data.get("start_offset_sec", 0))
-            length = int(chapter_data.get("length_ms", 0)) / 1000
-            chapters.append(
-                MediaItemChapter(
-                    position=index, name=chapter_data.get("title"), start=start, end=start + length
-                )
+        if image_url := (audiobook_data.get("product_images") or {}).get("500"):
+            book.metadata.images = UniqueList(
+                [
+                    MediaItemImage(
+                        type=ImageType.THUMB,
+                        path=image_url,
+                        provider=self.provider_instance,
+                        remotely_accessible=True,
+                    ),
+                    MediaItemImage(
+                        type=ImageType.CLEARART,
+                        path=image_url,
+                        provider=self.provider_instance,
+                        remotely_accessible=True,
+                    ),
+                ]
             )
         book.metadata.chapters = chapters
-        book.resume_position_ms = await self.get_last_postion(asin=asin)
+        book.resume_position_ms = resume_position_ms
         return book
 
     async def deregister(self) -> None:
@@ -291,12 +466,46 @@ class AudibleHelper:
         await asyncio.to_thread(self.client.auth.deregister_device)
 
 
+class _HTMLTextExtractor(HTMLParser):
+    """Collect the text content of a HTML snippet, skipping scripts and styles."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in ("script", "style"):
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ("script", "style") and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def get_text(self) -> str:
+        return "".join(self._parts)
+
+
+def _get_checksum(audiobook_data: dict[str, Any]) -> str:
+    """Return a checksum of the (raw) library item data."""
+    raw_data = json.dumps(audiobook_data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw_data, digest_size=16).hexdigest()
+
+
 def _html_to_txt(html_text: str) -> str:
-    txt = html.unescape(html_text)
-    tags = re.findall("<[^>]+>", txt)
-    for tag in tags:
-        txt = txt.replace(tag, "")
-    return txt
+    # the parser already decodes character references (convert_charrefs)
+    parser = _HTMLTextExtractor()
+    try:
+        parser.feed(html_text)
+        parser.close()
+    except Exception:
+        # fall back to plain tag stripping on (very) malformed input
+        return html.unescape(HTML_TAG_PATTERN.sub("", html_text))
+    return parser.get_text()
 
 
 # Audible Authorization
@@ -315,19 +524,20 @@ async def audible_get_auth_info(locale: str) -> tuple[str, str, str]:
     # Create locale object (not I/O operation)
     locale_obj = audible.localization.Locale(locale)
 
-    # Create code verifier (potential crypto operations)
-    code_verifier = await asyncio.to_thread(audible.login.create_code_verifier)
+    # Create the code verifier and build the OAuth URL in a single executor job
+    return await asyncio.to_thread(_build_auth_info, locale_obj)
 
-    # Build OAuth URL (potential network operations)
-    oauth_url, serial = await asyncio.to_thread(
-        audible.login.build_oauth_url,
+
+def _build_auth_info(locale_obj: audible.localization.Locale) -> tuple[str, str, str]:
+    """Create the code verifier and OAuth URL (blocking, run in executor)."""
+    code_verifier = audible.login.create_code_verifier()
+    oauth_url, serial = audible.login.build_oauth_url(
         country_code=locale_obj.country_code,
         domain=locale_obj.domain,
         market_place_id=locale_obj.market_place_id,
         code_verifier=code_verifier,
         with_username=False,
     )
-
     return code_verifier.decode(), oauth_url, serial
 
 
@@ -373,11 +583,109 @@ async def audible_custom_login(
     return auth
 
 
-async def check_file_exists(path: str | PathLike[str]) -> bool:
-    """Async file exists check."""
-    return await asyncio.to_thread(os.path.exists, path)
+async def load_authenticator(auth_file: str) -> audible.Authenticator | None:
+    """
+    Load Authenticator from file, reusing the previously loaded one if the file is unchanged.
+
+    Returns None if the auth file is missing or does not contain (valid) authentication data.
+    """
+    if (mtime_ns := await asyncio.to_thread(_get_auth_file_mtime, auth_file)) is None:
+        return None
+    if (cached := _AUTH_CACHE.get(auth_file)) and cached[0] == mtime_ns:
+        return cached[1]
+    if (auth_data := await asyncio.to_thread(_read_auth_file, auth_file)) is None:
+        return None
+    try:
+        auth = audible.Authenticator.from_dict(auth_data)
+    except (TypeError, ValueError):
+        # malformed authentication data
+        return None
+    _AUTH_CACHE[auth_file] = (mtime_ns, auth)
+    return auth
+
+
+async def save_authenticator(auth: audible.Authenticator, auth_file: str) -> None:
+    """Save Authenticator to file and keep the loaded authenticators cache in sync.
+
+    The file is replaced atomically and only written if its contents actually changed.
+    """
+    auth_data = json.dumps(auth.to_dict(), indent=4).encode()
+    digest = hashlib.blake2b(auth_data).digest()
+    if _AUTH_FILE_DIGESTS.get(auth_file) == digest and (cached := _AUTH_CACHE.get(auth_file)):
+        # contents unchanged, no need to write
+        _AUTH_CACHE[auth_file] = (cached[0], auth)
+        return
+    mtime_ns = await asyncio.to_thread(_write_auth_file, auth_file, auth_data)
+    _AUTH_CACHE[auth_file] = (mtime_ns, auth)
+    _AUTH_FILE_DIGESTS[auth_file] = digest
+
+
+def get_auth_file_name(locale: str, serial: str) -> str:
+    """Return the (deterministic) auth file name for a locale and device serial."""
+    digest = hashlib.blake2s(f"{locale}:{serial}".encode(), digest_size=8).hexdigest()
+    return f"{AUTH_FILE_PREFIX}{digest}.json"
+
+
+async def remove_stale_auth_files(storage_path: str, keep: set[str]) -> None:
+    """Remove all auth files in the storage path that are not in the keep set."""
+    async with _AUTH_FILES_LOCK:
+        stale_files = await asyncio.to_thread(_get_stale_auth_files, storage_path, keep)
+        for auth_file in stale_files:
+            await remove_file(auth_file)
+            invalidate_authenticator(auth_file)
+
+
+def _get_stale_auth_files(storage_path: str, keep: set[str]) -> list[str]:
+    """Return the auth files in the storage path that are not in the keep set."""
+    return [
+        str(auth_file)
+        for auth_file in Path(storage_path).glob(f"{AUTH_FILE_PREFIX}*.json")
+        if str(auth_file) not in keep
+    ]
+
+
+def invalidate_authenticator(auth_file: str) -> None:
+    """Forget a (previously) loaded Authenticator."""
+    _AUTH_CACHE.pop(auth_file, None)
+    _AUTH_FILE_DIGESTS.pop(auth_file, None)
+
+
+def _write_auth_file(auth_file: str, auth_data: bytes) -> int:
+    """Atomically (over)write the auth file and return its new mtime."""
+    tmp_file = Path(f"{auth_file}.tmp")
+    tmp_file.write_bytes(auth_data)
+    tmp_file.replace(auth_file)
+    return os.stat(auth_file).st_mtime_ns
+
+
+def _get_auth_file_mtime(auth_file: str) -> int | None:
+    """Return the mtime of the auth file, or None if it is not a (non empty) regular file."""
+    try:
+        file_stat = os.stat(auth_file)
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+        return None
+    return file_stat.st_mtime_ns
+
+
+def _read_auth_file(auth_file: str) -> dict[str, Any] | None:
+    """Read the auth file, return None if it does not contain the required authentication data."""
+    try:
+        with open(auth_file, "rb") as _file:
+            raw_data = _file.read()
+        auth_data = json.loads(raw_data)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(auth_data, dict):
+        return None
+    if not all(auth_data.get(key) for key in AUTH_FILE_REQUIRED_KEYS):
+        return None
+    _AUTH_FILE_DIGESTS[auth_file] = hashlib.blake2b(raw_data).digest()
+    return auth_data
 
 
 async def remove_file(path: str | PathLike[str]) -> None:
-    """Async file delete."""
-    await asyncio.to_thread(os.remove, path)
+    """Async file delete, a missing file is ignored."""
+    with suppress(FileNotFoundError):
+        await remove(path)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator, Sequence
+from functools import partial
 from typing import TYPE_CHECKING
 
 import aioaudiobookshelf as aioabs
@@ -22,6 +24,7 @@ from aioaudiobookshelf.schema.library import (
     LibraryItemMinifiedPodcast,
 )
 from aioaudiobookshelf.schema.library import LibraryMediaType as AbsLibraryMediaType
+from aioaudiobookshelf.schema.podcast import PodcastEpisodeExpanded as AbsPodcastEpisodeExpanded
 from music_assistant_models.config_entries import ConfigEntry, ConfigValueType, ProviderConfig
 from music_assistant_models.enums import (
     ConfigEntryType,
@@ -44,6 +47,7 @@ from music_assistant_models.streamdetails import StreamDetails
 from music_assistant.helpers.ffmpeg import get_ffmpeg_stream
 from music_assistant.models.music_provider import MusicProvider
 from music_assistant.providers.audiobookshelf.parsers import (
+    ParseKwargs,
     parse_audiobook,
     parse_podcast,
     parse_podcast_episode,
@@ -63,7 +67,13 @@ from .constants import (
     AbsBrowseItemsPodcast,
     AbsBrowsePaths,
 )
-from .helpers import LibrariesHelper, LibraryHelper, ProgressGuard
+from .helpers import (
+    ItemCache,
+    LibrariesHelper,
+    LibraryHelper,
+    ProgressGuard,
+    merge_async_generators,
+)
 
 if TYPE_CHECKING:
     from aioaudiobookshelf.schema.events_socket import LibraryItemRemoved
@@ -75,6 +85,11 @@ if TYPE_CHECKING:
     from music_assistant.mass import MusicAssistant
     from music_assistant.models import ProviderInstanceType
 
+# expanded podcast and its episodes by id, along with their 1-based position
+AbsPodcastWithEpisodes = tuple[
+    AbsLibraryItemExpandedPodcast, dict[str, tuple[int, AbsPodcastEpisodeExpanded]]
+]
+
 
 async def setup(
     mass: MusicAssistant, manifest: ProviderManifest, config: ProviderConfig
@@ -197,6 +212,18 @@ class Audiobookshelf(MusicProvider):
         except AbsLoginError as exc:
             raise LoginFailed(f"Login to abs instance at {base_url} failed.") from exc
 
+        # config values used when parsing items and building stream urls
+        self._base_url = base_url.rstrip("/")
+        self._hide_empty_podcasts = bool(self.config.get_value(CONF_HIDE_EMPTY_PODCASTS))
+        # common arguments of the parse functions, built once instead of per parsed item
+        self._parse_kwargs = ParseKwargs(
+            lookup_key=self.lookup_key,
+            domain=self.domain,
+            instance_id=self.instance_id,
+            token=self._client.token,
+            base_url=self._base_url,
+        )
+
         self.cache_base_key = self.instance_id
 
         cached_libraries = await self.mass.cache.get(
@@ -226,6 +253,10 @@ class Audiobookshelf(MusicProvider):
         # progress guard
         self.progress_guard = ProgressGuard()
 
+        # expanded items are requested repeatedly on playback and playlog updates
+        self._podcast_cache: ItemCache[AbsPodcastWithEpisodes] = ItemCache()
+        self._audiobook_cache: ItemCache[AbsLibraryItemExpandedBook] = ItemCache()
+
         # update playlog information if just started
         user = await self._client.get_my_user()
         await self._set_playlog_from_user(user)
@@ -237,8 +268,7 @@ class Audiobookshelf(MusicProvider):
         Called when provider is deregistered (e.g. MA exiting or config reloading).
         is_removed will be set to True when the provider is removed from the configuration.
         """
-        await self._client.logout()
-        await self._client_socket.logout()
+        await asyncio.gather(self._client.logout(), self._client_socket.logout())
 
     @property
     def is_streaming_provider(self) -> bool:
@@ -268,51 +298,66 @@ class Audiobookshelf(MusicProvider):
         """Retrieve library/subscribed podcasts from the provider.
 
         Minified podcast information is enough.
+        Libraries are retrieved concurrently.
         """
-        for pod_lib_id in self.libraries.podcasts:
-            async for response in self._client.get_library_items(library_id=pod_lib_id):
-                if not response.results:
-                    break
-                podcast_ids = [x.id_ for x in response.results]
-                # store uuids
-                self.libraries.podcasts[pod_lib_id].item_ids.update(podcast_ids)
-                for podcast_minified in response.results:
-                    assert isinstance(podcast_minified, LibraryItemMinifiedPodcast)
-                    mass_podcast = parse_podcast(
-                        abs_podcast=podcast_minified,
-                        lookup_key=self.lookup_key,
-                        domain=self.domain,
-                        instance_id=self.instance_id,
-                        token=self._client.token,
-                        base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                    )
-                    if (
-                        bool(self.config.get_value(CONF_HIDE_EMPTY_PODCASTS))
-                        and mass_podcast.total_episodes == 0
-                    ):
-                        continue
-                    yield mass_podcast
+        async for mass_podcast in merge_async_generators(
+            *(self._get_library_podcasts(pod_lib_id) for pod_lib_id in self.libraries.podcasts)
+        ):
+            yield mass_podcast
+
+    async def _get_library_podcasts(self, pod_lib_id: str) -> AsyncGenerator[Podcast, None]:
+        """Retrieve podcasts of a single podcast library."""
+        # the next page is fetched while the current one is parsed
+        async for response in merge_async_generators(
+            self._client.get_library_items(library_id=pod_lib_id)
+        ):
+            if not response.results:
+                break
+            podcast_ids = [x.id_ for x in response.results]
+            # store uuids
+            self.libraries.podcasts[pod_lib_id].item_ids.update(podcast_ids)
+            for podcast_minified in response.results:
+                assert isinstance(podcast_minified, LibraryItemMinifiedPodcast)
+                if self._hide_empty_podcasts and podcast_minified.media.num_episodes == 0:
+                    continue
+                mass_podcast = parse_podcast(
+                    abs_podcast=podcast_minified,
+                    **self._parse_kwargs,
+                )
+                yield mass_podcast
 
     async def _get_abs_expanded_podcast(
         self, prov_podcast_id: str
     ) -> AbsLibraryItemExpandedPodcast:
+        abs_podcast, _ = await self._get_abs_expanded_podcast_with_episodes(
+            prov_podcast_id=prov_podcast_id
+        )
+        return abs_podcast
+
+    async def _get_abs_expanded_podcast_with_episodes(
+        self, prov_podcast_id: str
+    ) -> AbsPodcastWithEpisodes:
+        return await self._podcast_cache.get_or_fetch(
+            prov_podcast_id, partial(self._fetch_abs_expanded_podcast, prov_podcast_id)
+        )
+
+    async def _fetch_abs_expanded_podcast(self, prov_podcast_id: str) -> AbsPodcastWithEpisodes:
         abs_podcast = await self._client.get_library_item_podcast(
             podcast_id=prov_podcast_id, expanded=True
         )
         assert isinstance(abs_podcast, AbsLibraryItemExpandedPodcast)
-
-        return abs_podcast
+        episodes = {
+            abs_episode.id_: (episode_cnt, abs_episode)
+            for episode_cnt, abs_episode in enumerate(abs_podcast.media.episodes, 1)
+        }
+        return abs_podcast, episodes
 
     async def get_podcast(self, prov_podcast_id: str) -> Podcast:
         """Get single podcast."""
         abs_podcast = await self._get_abs_expanded_podcast(prov_podcast_id=prov_podcast_id)
         return parse_podcast(
             abs_podcast=abs_podcast,
-            lookup_key=self.lookup_key,
-            domain=self.domain,
-            instance_id=self.instance_id,
-            token=self._client.token,
-            base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+            **self._parse_kwargs,
         )
 
     async def get_podcast_episodes(
@@ -339,11 +384,7 @@ class Audiobookshelf(MusicProvider):
                 episode=abs_episode,
                 prov_podcast_id=prov_podcast_id,
                 fallback_episode_cnt=episode_cnt,
-                lookup_key=self.lookup_key,
-                domain=self.domain,
-                instance_id=self.instance_id,
-                token=self._client.token,
-                base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+                **self._parse_kwargs,
                 media_progress=progress,
             )
             yield mass_episode
@@ -354,36 +395,45 @@ class Audiobookshelf(MusicProvider):
     ) -> PodcastEpisode:
         """Get single podcast episode."""
         prov_podcast_id, e_id = prov_episode_id.split(" ")
-        abs_podcast = await self._get_abs_expanded_podcast(prov_podcast_id=prov_podcast_id)
-        episode_cnt = 1
-        for abs_episode in abs_podcast.media.episodes:
-            if abs_episode.id_ == e_id:
-                progress = None
-                if add_progress:
-                    progress = await self._client.get_my_media_progress(
-                        item_id=prov_podcast_id, episode_id=abs_episode.id_
-                    )
-                return parse_podcast_episode(
-                    episode=abs_episode,
-                    prov_podcast_id=prov_podcast_id,
-                    fallback_episode_cnt=episode_cnt,
-                    lookup_key=self.lookup_key,
-                    domain=self.domain,
-                    instance_id=self.instance_id,
-                    token=self._client.token,
-                    base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                    media_progress=progress,
-                )
-
-            episode_cnt += 1
-        raise MediaNotFoundError("Episode not found")
+        progress = None
+        if add_progress:
+            (_, episodes), progress = await asyncio.gather(
+                self._get_abs_expanded_podcast_with_episodes(prov_podcast_id=prov_podcast_id),
+                self._client.get_my_media_progress(item_id=prov_podcast_id, episode_id=e_id),
+            )
+        else:
+            _, episodes = await self._get_abs_expanded_podcast_with_episodes(
+                prov_podcast_id=prov_podcast_id
+            )
+        if (episode := episodes.get(e_id)) is None:
+            raise MediaNotFoundError("Episode not found")
+        episode_cnt, abs_episode = episode
+        return parse_podcast_episode(
+            episode=abs_episode,
+            prov_podcast_id=prov_podcast_id,
+            fallback_episode_cnt=episode_cnt,
+            **self._parse_kwargs,
+            media_progress=progress,
+        )
 
     async def get_library_audiobooks(self) -> AsyncGenerator[Audiobook, None]:
         """Get Audiobook libraries.
 
         Need expanded version for chapters.
+        Libraries are retrieved concurrently.
         """
-        for book_lib_id in self.libraries.audiobooks:
+        async for mass_audiobook in merge_async_generators(
+            *(
+                self._get_library_audiobooks(book_lib_id)
+                for book_lib_id in self.libraries.audiobooks
+            )
+        ):
+            yield mass_audiobook
+
+    async def _get_library_audiobooks(self, book_lib_id: str) -> AsyncGenerator[Audiobook, None]:
+        """Retrieve audiobooks of a single audiobook library."""
+
+        async def _get_pages_expanded() -> AsyncGenerator[list[LibraryItemExpandedBook], None]:
             async for response in self._client.get_library_items(library_id=book_lib_id):
                 if not response.results:
                     break
@@ -391,20 +441,26 @@ class Audiobookshelf(MusicProvider):
                 # store uuids
                 self.libraries.audiobooks[book_lib_id].item_ids.update(book_ids)
                 # use expanded version for chapters/ caching.
-                books_expanded = await self._client.get_library_item_batch_book(item_ids=book_ids)
-                for book_expanded in books_expanded:
-                    mass_audiobook = parse_audiobook(
-                        abs_audiobook=book_expanded,
-                        lookup_key=self.lookup_key,
-                        domain=self.domain,
-                        instance_id=self.instance_id,
-                        token=self._client.token,
-                        base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                    )
-                    yield mass_audiobook
+                yield await self._client.get_library_item_batch_book(item_ids=book_ids)
+
+        # the next page is fetched and expanded while the current one is parsed
+        async for books_expanded in merge_async_generators(_get_pages_expanded()):
+            for book_expanded in books_expanded:
+                mass_audiobook = parse_audiobook(
+                    abs_audiobook=book_expanded,
+                    **self._parse_kwargs,
+                )
+                yield mass_audiobook
 
     async def _get_abs_expanded_audiobook(
         self, prov_audiobook_id: str
+    ) -> AbsLibraryItemExpandedBook:
+        return await self._audiobook_cache.get_or_fetch(
+            prov_audiobook_id, partial(self._fetch_abs_expanded_audiobook, prov_audiobook_id)
+        )
+
+    async def _fetch_abs_expanded_audiobook(
+        self, prov_audiobook_id: str
     ) -> AbsLibraryItemExpandedBook:
         abs_audiobook = await self._client.get_library_item_book(
             book_id=prov_audiobook_id, expanded=True
@@ -422,11 +478,7 @@ class Audiobookshelf(MusicProvider):
         abs_audiobook = await self._get_abs_expanded_audiobook(prov_audiobook_id=prov_audiobook_id)
         return parse_audiobook(
             abs_audiobook=abs_audiobook,
-            lookup_key=self.lookup_key,
-            domain=self.domain,
-            instance_id=self.instance_id,
-            token=self._client.token,
-            base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+            **self._parse_kwargs,
             media_progress=progress,
         )
 
@@ -444,8 +496,9 @@ class Audiobookshelf(MusicProvider):
     ) -> StreamDetails:
         """Streamdetails audiobook."""
         tracks = abs_audiobook.media.tracks
-        token = self._client.token
-        base_url = str(self.config.get_value(CONF_URL))
+        base_url = self._base_url
+        # use the current token, the client may have re-authenticated since init
+        query = f"?token={self._client.token}"
         if len(tracks) == 0:
             raise MediaNotFoundError("Stream not found")
         if len(tracks) > 1:
@@ -453,7 +506,7 @@ class Audiobookshelf(MusicProvider):
             multiple_files = []
             for track in tracks:
                 media_url = track.content_url
-                stream_url = f"{base_url}{media_url}?token={token}"
+                stream_url = f"{base_url}{media_url}{query}"
                 content_type = ContentType.UNKNOWN
                 if track.metadata is not None:
                     content_type = ContentType.try_parse(track.metadata.ext)
@@ -485,7 +538,7 @@ class Audiobookshelf(MusicProvider):
 
         track = abs_audiobook.media.tracks[0]
         media_url = track.content_url
-        stream_url = f"{base_url}{media_url}?token={token}"
+        stream_url = f"{base_url}{media_url}{query}"
         content_type = ContentType.UNKNOWN
         if track.metadata is not None:
             content_type = ContentType.try_parse(track.metadata.ext)
@@ -505,19 +558,16 @@ class Audiobookshelf(MusicProvider):
     async def _get_stream_details_episode(self, podcast_id: str) -> StreamDetails:
         """Streamdetails of a podcast episode."""
         abs_podcast_id, abs_episode_id = podcast_id.split(" ")
-        abs_episode = None
 
-        abs_podcast = await self._get_abs_expanded_podcast(prov_podcast_id=abs_podcast_id)
-        for abs_episode in abs_podcast.media.episodes:
-            if abs_episode.id_ == abs_episode_id:
-                break
-        if abs_episode is None:
+        _, episodes = await self._get_abs_expanded_podcast_with_episodes(
+            prov_podcast_id=abs_podcast_id
+        )
+        if (episode := episodes.get(abs_episode_id)) is None:
             raise MediaNotFoundError("Stream not found")
+        _, abs_episode = episode
         self.logger.debug(f'Using direct playback for podcast episode "{abs_episode.title}".')
-        token = self._client.token
-        base_url = str(self.config.get_value(CONF_URL))
         media_url = abs_episode.audio_track.content_url
-        full_url = f"{base_url}{media_url}?token={token}"
+        full_url = f"{self._base_url}{media_url}?token={self._client.token}"
         content_type = ContentType.UNKNOWN
         if abs_episode.audio_track.metadata is not None:
             content_type = ContentType.try_parse(abs_episode.audio_track.metadata.ext)
@@ -970,14 +1020,11 @@ class Audiobookshelf(MusicProvider):
                 self.logger.debug(
                     'Updated book "%s" via socket.', abs_item.media.metadata.title or ""
                 )
+                self._audiobook_cache.remove(abs_item.id_)
                 await self.mass.music.audiobooks.add_item_to_library(
                     parse_audiobook(
                         abs_audiobook=abs_item,
-                        lookup_key=self.lookup_key,
-                        domain=self.domain,
-                        instance_id=self.instance_id,
-                        token=self._client.token,
-                        base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+                        **self._parse_kwargs,
                     ),
                     overwrite_existing=True,
                 )
@@ -988,18 +1035,12 @@ class Audiobookshelf(MusicProvider):
                 self.logger.debug(
                     'Updated podcast "%s" via socket.', abs_item.media.metadata.title or ""
                 )
+                self._podcast_cache.remove(abs_item.id_)
                 mass_podcast = parse_podcast(
                     abs_podcast=abs_item,
-                    lookup_key=self.lookup_key,
-                    domain=self.domain,
-                    instance_id=self.instance_id,
-                    token=self._client.token,
-                    base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+                    **self._parse_kwargs,
                 )
-                if not (
-                    bool(self.config.get_value(CONF_HIDE_EMPTY_PODCASTS))
-                    and mass_podcast.total_episodes == 0
-                ):
+                if not (self._hide_empty_podcasts and mass_podcast.total_episodes == 0):
                     await self.mass.music.podcasts.add_item_to_library(
                         mass_podcast,
                         overwrite_existing=True,
@@ -1011,6 +1052,8 @@ class Audiobookshelf(MusicProvider):
 
     async def _socket_abs_item_removed(self, item: LibraryItemRemoved) -> None:
         """Item removed."""
+        self._podcast_cache.remove(item.id_)
+        self._audiobook_cache.remove(item.id_)
         media_type: MediaType | None = None
         for lib in self.libraries.audiobooks.values():
             if item.id_ in lib.item_ids:
@@ -1052,8 +1095,7 @@ class Audiobookshelf(MusicProvider):
         if not self.progress_guard.guard_ok_abs(abs_progress=progress):
             return
 
-        known_ids = self._get_all_known_item_ids()
-        if progress.library_item_id not in known_ids:
+        if not self._is_known_item_id(progress.library_item_id):
             return
 
         self.logger.debug(f"Updated progress of item {progress.library_item_id} via socket.")
@@ -1063,6 +1105,12 @@ class Audiobookshelf(MusicProvider):
             return
         await self._update_playlog_episode(progress)
 
+    def _is_known_item_id(self, item_id: str) -> bool:
+        return any(
+            item_id in lib.item_ids
+            for lib in (*self.libraries.podcasts.values(), *self.libraries.audiobooks.values())
+        )
+
     def _get_all_known_item_ids(self) -> set[str]:
         known_ids = set()
         for lib in self.libraries.podcasts.values():
@@ -1,11 +1,18 @@
 """Helpers for Audiobookshelf provider."""
 
+import asyncio
 import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from contextlib import aclosing
 from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
 
 from aioaudiobookshelf.schema.media_progress import MediaProgress
 from mashumaro.mixins.dict import DataClassDictMixin
 
+_T = TypeVar("_T")
+
 
 @dataclass(kw_only=True)
 class LibraryHelper(DataClassDictMixin):
@@ -108,3 +115,102 @@ class ProgressGuard:
             int(time.time() * 1000) - stored_progress.last_update_ms
             >= self._min_time_between_updates_ms
         )
+
+
+class ItemCache(Generic[_T]):
+    """Short-lived in-memory cache for expanded abs library items.
+
+    Expanded items are requested repeatedly within a short time frame, e.g. on
+    playback (episode, stream details, progress) or when the full playlog is
+    synced. Entries expire after ttl seconds and the least recently used entry
+    is dropped once max_items is reached. Concurrent fetches of the same item
+    are coalesced into a single request.
+    """
+
+    def __init__(self, max_items: int = 32, ttl: float = 60) -> None:
+        """Init."""
+        self._items: OrderedDict[str, tuple[float, _T]] = OrderedDict()
+        self._max_items = max_items
+        self._ttl = ttl
+        self._inflight: dict[str, asyncio.Task[_T]] = {}
+
+    def get(self, item_id: str) -> _T | None:
+        """Get a cached item, None if unknown or expired."""
+        if (cached := self._items.get(item_id)) is None:
+            return None
+        expires, item = cached
+        if expires < time.monotonic():
+            del self._items[item_id]
+            return None
+        self._items.move_to_end(item_id)
+        return item
+
+    def set(self, item_id: str, item: _T) -> None:
+        """Store an item."""
+        self._items.pop(item_id, None)
+        if len(self._items) >= self._max_items:
+            self._items.popitem(last=False)
+        self._items[item_id] = (time.monotonic() + self._ttl, item)
+
+    def remove(self, item_id: str) -> None:
+        """Remove an item, e.g. if it was updated in abs."""
+        self._items.pop(item_id, None)
+        # a fetch that is still in flight may return the outdated item, don't store it
+        self._inflight.pop(item_id, None)
+
+    async def get_or_fetch(self, item_id: str, fetch: Callable[[], Coroutine[Any, Any, _T]]) -> _T:
+        """Get a cached item or fetch and store it."""
+        if (item := self.get(item_id)) is not None:
+            return item
+        if (task := self._inflight.get(item_id)) is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[item_id] = task
+            task.add_done_callback(lambda task: self._on_fetch_done(item_id, task))
+        # shielded, so a cancelled caller does not abort the fetch for the others
+        return await asyncio.shield(task)
+
+    def _on_fetch_done(self, item_id: str, task: asyncio.Task[_T]) -> None:
+        if self._inflight.get(item_id) is not task:
+            return
+        del self._inflight[item_id]
+        if not task.cancelled() and task.exception() is None:
+            self.set(item_id, task.result())
+
+
+async def merge_async_generators(
+    *generators: AsyncGenerator[_T, None], maxsize: int = 1
+) -> AsyncGenerator[_T, None]:
+    """Drain multiple async generators concurrently and yield their items as they arrive.
+
+    The order of items of a single generator is kept. Each generator is run in its own
+    task, which may run ahead of the consumer by at most maxsize items in total.
+    An exception of a generator is raised once its preceding items were yielded.
+    """
+    queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize)
+
+    async def _produce(generator: AsyncGenerator[_T, None]) -> None:
+        try:
+            # close the generator right away when cancelled, not when it is garbage collected
+            async with aclosing(generator):
+                async for item in generator:
+                    await queue.put((False, item))
+        except Exception as err:
+            await queue.put((True, err))
+        else:
+            await queue.put((True, None))
+
+    tasks = [asyncio.create_task(_produce(generator)) for generator in generators]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            done, value = await queue.get()
+            if not done:
+                yield value
+                continue
+            remaining -= 1
+            if value is not None:
+                raise value
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
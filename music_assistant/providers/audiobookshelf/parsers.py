@@ -1,5 +1,7 @@
 """Parser for ABS -> MASS."""
 
+from typing import TypedDict
+
 from aioaudiobookshelf.schema.library import (
     LibraryItemExpandedBook as AbsLibraryItemExpandedBook,
 )
@@ -31,6 +33,16 @@ from music_assistant_models.media_items import Podcast as MassPodcast
 from music_assistant_models.media_items import PodcastEpisode as MassPodcastEpisode
 
 
+class ParseKwargs(TypedDict):
+    """Provider specific arguments shared by all parse functions."""
+
+    lookup_key: str
+    domain: str
+    instance_id: str
+    token: str | None
+    base_url: str
+
+
 def parse_podcast(
     *,
     abs_podcast: AbsLibraryItemExpandedPodcast
@@ -9,13 +9,15 @@ import os
 import os.path
 import time
 import urllib.parse
+from collections import OrderedDict, deque
 from collections.abc import AsyncGenerator, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from stat import S_ISDIR, S_ISLNK
 from typing import TYPE_CHECKING, Any, cast
 
 import aiofiles
 import shortuuid
-import xmltodict
 from aiofiles.os import wrap
 from music_assistant_models.enums import (
     ContentType,
@@ -81,6 +83,9 @@ from .constants import (
     PLAYLIST_EXTENSIONS,
     PODCAST_EPISODE_EXTENSIONS,
     SUPPORTED_EXTENSIONS,
+    SYNC_TAG_PARSE_WORKERS,
+    TAGGED_EXTENSIONS,
+    TAGS_CACHE_MAX_ITEMS,
     TRACK_EXTENSIONS,
     IsChapterFile,
 )
@@ -91,6 +96,7 @@ from .helpers import (
     get_album_dir,
     get_artist_dir,
     get_relative_path,
+    read_nfo_file,
     sorted_scandir,
 )
 
@@ -162,6 +168,9 @@ class LocalFileSystemProvider(MusicProvider):
         self.write_access: bool = False
         self.sync_running: bool = False
         self.media_content_type = cast(str, config.get_value(CONF_ENTRY_CONTENT_TYPE.key))
+        # small in-memory cache of parsed tags, keyed by relative path
+        # and validated against the checksum (mtime) and size of the file
+        self._tags_cache: OrderedDict[str, tuple[str | None, int, AudioTags]] = OrderedDict()
 
     @property
     def supported_features(self) -> set[ProviderFeature]:
@@ -333,33 +342,48 @@ class LocalFileSystemProvider(MusicProvider):
         # in a single executor thread to save the overhead of having to spin up tons of tasks
         def listdir(path: str) -> Iterator[FileSystemItem]:
             """Recursively traverse directory entries."""
-            for item in os.scandir(path):
+            # collect the entries first so the directory handle is closed
+            # before descending into the subdirectories
+            with os.scandir(path) as it:
+                entries = list(it)
+            for item in entries:
                 # ignore invalid filenames
                 if item.name in IGNORE_DIRS or item.name.startswith((".", "_")):
                     continue
                 if item.is_dir(follow_symlinks=False):
                     yield from listdir(item.path)
                 elif item.is_file(follow_symlinks=False):
-                    # skip files without extension
-                    if "." not in item.name:
-                        continue
-                    ext = item.name.rsplit(".", 1)[1].lower()
-                    if ext not in SUPPORTED_EXTENSIONS:
-                        # skip unsupported file extension
+                    # skip files without (supported) extension
+                    _, sep, ext = item.name.rpartition(".")
+                    if not sep or ext.lower() not in SUPPORTED_EXTENSIONS:
                         continue
                     yield FileSystemItem.from_dir_entry(item, self.base_path)
 
         def run_sync() -> None:
             """Run the actual sync (in an executor job)."""
             self.sync_running = True
+            # tag parsing (ffprobe) is the slow part, so we parse the tags of the next
+            # (changed) files in a small thread pool while the items are still
+            # processed (and added to the library) one by one in the original order
+            pending: deque[tuple[FileSystemItem, str | None, Future[AudioTags] | None]] = deque()
             try:
-                for item in listdir(self.base_path):
-                    cur_filenames.add(item.relative_path)
-                    # continue if the item did not change (checksum still the same)
-                    prev_checksum = file_checksums.get(item.relative_path)
-                    if item.checksum == prev_checksum:
-                        continue
-                    self._process_item(item, prev_checksum)
+                with ThreadPoolExecutor(SYNC_TAG_PARSE_WORKERS) as executor:
+                    for item in listdir(self.base_path):
+                        cur_filenames.add(item.relative_path)
+                        # continue if the item did not change (checksum still the same)
+                        prev_checksum = file_checksums.get(item.relative_path)
+                        if item.checksum == prev_checksum:
+                            continue
+                        tags_future = (
+                            executor.submit(parse_tags, item.absolute_path, item.file_size)
+                            if self._item_needs_tags(item)
+                            else None
+                        )
+                        pending.append((item, prev_checksum, tags_future))
+                        if len(pending) > SYNC_TAG_PARSE_WORKERS * 2:
+                            self._process_item(*pending.popleft())
+                    while pending:
+                        self._process_item(*pending.popleft())
             finally:
                 self.sync_running = False
 
@@ -378,13 +402,27 @@ class LocalFileSystemProvider(MusicProvider):
         # process orphaned albums and artists
         await self._process_orphaned_albums_and_artists()
 
-    def _process_item(self, item: FileSystemItem, prev_checksum: str | None) -> None:
+    def _item_needs_tags(self, item: FileSystemItem) -> bool:
+        """Return if the (changed) item needs its tags parsed to be processed."""
+        return item.ext in TAGGED_EXTENSIONS.get(self.media_content_type, ())
+
+    def _process_item(
+        self,
+        item: FileSystemItem,
+        prev_checksum: str | None,
+        tags_future: Future[AudioTags] | None = None,
+    ) -> None:
         """Process a single item. NOT async friendly."""
         try:
             self.logger.debug("Processing: %s", item.relative_path)
-            if item.ext in TRACK_EXTENSIONS and self.media_content_type == "music":
+            ext = item.ext
+            if ext in TRACK_EXTENSIONS and self.media_content_type == "music":
                 # handle track item
-                tags = parse_tags(item.absolute_path, item.file_size)
+                tags = (
+                    tags_future.result()
+                    if tags_future
+                    else parse_tags(item.absolute_path, item.file_size)
+                )
 
                 async def process_track() -> None:
                     track = await self._parse_track(item, tags)
@@ -398,9 +436,13 @@ class LocalFileSystemProvider(MusicProvider):
                 asyncio.run_coroutine_threadsafe(process_track(), self.mass.loop).result()
                 return
 
-            if item.ext in AUDIOBOOK_EXTENSIONS and self.media_content_type == "audiobooks":
+            if ext in AUDIOBOOK_EXTENSIONS and self.media_content_type == "audiobooks":
                 # handle audiobook item
-                tags = parse_tags(item.absolute_path, item.file_size)
+                tags = (
+                    tags_future.result()
+                    if tags_future
+                    else parse_tags(item.absolute_path, item.file_size)
+                )
 
                 async def process_audiobook() -> None:
                     try:
@@ -417,9 +459,13 @@ class LocalFileSystemProvider(MusicProvider):
                 asyncio.run_coroutine_threadsafe(process_audiobook(), self.mass.loop).result()
                 return
 
-            if item.ext in PODCAST_EPISODE_EXTENSIONS and self.media_content_type == "podcasts":
+            if ext in PODCAST_EPISODE_EXTENSIONS and self.media_content_type == "podcasts":
                 # handle podcast(episode) item
-                tags = parse_tags(item.absolute_path, item.file_size)
+                tags = (
+                    tags_future.result()
+                    if tags_future
+                    else parse_tags(item.absolute_path, item.file_size)
+                )
 
                 async def process_episode() -> None:
                     episode = await self._parse_podcast_episode(item, tags)
@@ -434,7 +480,7 @@ class LocalFileSystemProvider(MusicProvider):
                 asyncio.run_coroutine_threadsafe(process_episode(), self.mass.loop).result()
                 return
 
-            if item.ext in PLAYLIST_EXTENSIONS and self.media_content_type == "music":
+            if ext in PLAYLIST_EXTENSIONS and self.media_content_type == "music":
 
                 async def process_playlist() -> None:
                     playlist = await self.get_playlist(item.relative_path)
@@ -575,7 +621,7 @@ class LocalFileSystemProvider(MusicProvider):
             for prov_mapping in track.provider_mappings:
                 if prov_mapping.provider_instance == self.instance_id:
                     file_item = await self.resolve(prov_mapping.item_id)
-                    tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+                    tags = await self._get_file_tags(file_item)
                     full_track = await self._parse_track(file_item, tags)
                     assert isinstance(full_track.album, Album)
                     return full_track.album
@@ -585,21 +631,21 @@ class LocalFileSystemProvider(MusicProvider):
     async def get_track(self, prov_track_id: str) -> Track:
         """Get full track details by id."""
         # ruff: noqa: PLR0915, PLR0912
-        if not await self.exists(prov_track_id):
+        try:
+            file_item = await self.resolve(prov_track_id)
+        except FileNotFoundError as err:
             msg = f"Track path does not exist: {prov_track_id}"
-            raise MediaNotFoundError(msg)
-
-        file_item = await self.resolve(prov_track_id)
-        tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+            raise MediaNotFoundError(msg) from err
+        tags = await self._get_file_tags(file_item)
         return await self._parse_track(file_item, tags=tags, full_album_metadata=True)
 
     async def get_playlist(self, prov_playlist_id: str) -> Playlist:
         """Get full playlist details by id."""
-        if not await self.exists(prov_playlist_id):
+        try:
+            file_item = await self.resolve(prov_playlist_id)
+        except FileNotFoundError as err:
             msg = f"Playlist path does not exist: {prov_playlist_id}"
-            raise MediaNotFoundError(msg)
-
-        file_item = await self.resolve(prov_playlist_id)
+            raise MediaNotFoundError(msg) from err
         playlist = Playlist(
             item_id=file_item.relative_path,
             provider=self.instance_id,
@@ -628,12 +674,12 @@ class LocalFileSystemProvider(MusicProvider):
     async def get_audiobook(self, prov_audiobook_id: str) -> Audiobook:
         """Get full audiobook details by id."""
         # ruff: noqa: PLR0915, PLR0912
-        if not await self.exists(prov_audiobook_id):
+        try:
+            file_item = await self.resolve(prov_audiobook_id)
+        except FileNotFoundError as err:
             msg = f"Audiobook path does not exist: {prov_audiobook_id}"
-            raise MediaNotFoundError(msg)
-
-        file_item = await self.resolve(prov_audiobook_id)
-        tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+            raise MediaNotFoundError(msg) from err
+        tags = await self._get_file_tags(file_item)
         return await self._parse_audiobook(file_item, tags=tags)
 
     async def get_podcast(self, prov_podcast_id: str) -> Podcast:
@@ -684,14 +730,22 @@ class LocalFileSystemProvider(MusicProvider):
             else:
                 playlist_lines = parse_pls(playlist_data)
 
-            for idx, playlist_line in enumerate(playlist_lines, 1):
-                if "#EXT" in playlist_line.path:
-                    continue
-                if track := await self._parse_playlist_line(
-                    playlist_line.path, os.path.dirname(prov_playlist_id)
-                ):
+            # resolving and parsing the playlist entries (file lookups and tags) is the
+            # slow part so we process the entries concurrently and restore the order after
+            tracks: dict[int, Track] = {}
+            playlist_path = os.path.dirname(prov_playlist_id)
+
+            async def _process_playlist_line(idx: int, line: str) -> None:
+                if track := await self._parse_playlist_line(line, playlist_path):
                     track.position = idx
-                    result.append(track)
+                    tracks[idx] = track
+
+            async with TaskManager(self.mass, 10) as tm:
+                for idx, playlist_line in enumerate(playlist_lines, 1):
+                    if "#EXT" in playlist_line.path:
+                        continue
+                    await tm.create_task_with_limit(_process_playlist_line(idx, playlist_line.path))
+            result = [tracks[idx] for idx in sorted(tracks)]
 
         except Exception as err:
             self.logger.warning(
@@ -709,7 +763,7 @@ class LocalFileSystemProvider(MusicProvider):
         episodes: list[PodcastEpisode] = []
 
         async def _process_podcast_episode(item: FileSystemItem) -> None:
-            tags = await async_parse_tags(item.absolute_path, item.file_size)
+            tags = await self._get_file_tags(item)
             try:
                 episode = await self._parse_podcast_episode(item, tags)
             except MusicAssistantError as err:
@@ -752,7 +806,7 @@ class LocalFileSystemProvider(MusicProvider):
                 ):
                     with contextlib.suppress(FileNotFoundError):
                         file_item = await self.resolve(filename)
-                        tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+                        tags = await self._get_file_tags(file_item)
                         return await self._parse_track(file_item, tags)
             # all attempts failed
             raise MediaNotFoundError("Invalid path/uri")
@@ -1041,14 +1095,10 @@ class LocalFileSystemProvider(MusicProvider):
             return artist
 
         # grab additional metadata within the Artist's folder
-        nfo_file = os.path.join(artist_path, "artist.nfo")
-        if await self.exists(nfo_file):
+        nfo_file = self.get_absolute_path(os.path.join(artist_path, "artist.nfo"))
+        if info := await asyncio.to_thread(read_nfo_file, nfo_file):
             # found NFO file with metadata
             # https://kodi.wiki/view/NFO_files/Artists
-            nfo_file = self.get_absolute_path(nfo_file)
-            async with aiofiles.open(nfo_file) as _file:
-                data = await _file.read()
-            info = await asyncio.to_thread(xmltodict.parse, data)
             info = info["artist"]
             artist.name = info.get("title", info.get("name", name))
             if sort_name := info.get("sortname"):
@@ -1417,14 +1467,10 @@ class LocalFileSystemProvider(MusicProvider):
         for folder_path in (track_dir, album_dir):
             if not folder_path or not await self.exists(folder_path):
                 continue
-            nfo_file = os.path.join(folder_path, "album.nfo")
-            if await self.exists(nfo_file):
+            nfo_file = self.get_absolute_path(os.path.join(folder_path, "album.nfo"))
+            if info := await asyncio.to_thread(read_nfo_file, nfo_file):
                 # found NFO file with metadata
                 # https://kodi.wiki/view/NFO_files/Artists
-                nfo_file = self.get_absolute_path(nfo_file)
-                async with aiofiles.open(nfo_file) as _file:
-                    data = await _file.read()
-                info = await asyncio.to_thread(xmltodict.parse, data)
                 info = info["album"]
                 album.name = info.get("title", info.get("name", name))
                 if sort_name := info.get("sortname"):
@@ -1523,14 +1569,16 @@ class LocalFileSystemProvider(MusicProvider):
         absolute_path = self.get_absolute_path(file_path)
 
         def _create_item() -> FileSystemItem:
-            if os.path.isdir(absolute_path):
+            # a single stat call tells us both the type and the details of the item,
+            # only a symlink needs another lookup to see if it points to a directory
+            stat = os.stat(absolute_path, follow_symlinks=False)
+            if S_ISDIR(stat.st_mode) or (S_ISLNK(stat.st_mode) and os.path.isdir(absolute_path)):
                 return FileSystemItem(
                     filename=os.path.basename(file_path),
                     relative_path=get_relative_path(self.base_path, file_path),
                     absolute_path=absolute_path,
                     is_dir=True,
                 )
-            stat = os.stat(absolute_path, follow_symlinks=False)
             return FileSystemItem(
                 filename=os.path.basename(file_path),
                 relative_path=get_relative_path(self.base_path, file_path),
@@ -1550,6 +1598,22 @@ class LocalFileSystemProvider(MusicProvider):
         abs_path = self.get_absolute_path(file_path)
         return bool(await exists(abs_path))
 
+    async def _get_file_tags(self, file_item: FileSystemItem) -> AudioTags:
+        """Return the parsed tags for given file, served from cache if the file did not change."""
+        cache_key = file_item.relative_path
+        if (cached := self._tags_cache.get(cache_key)) and cached[:2] == (
+            file_item.checksum,
+            file_item.file_size,
+        ):
+            self._tags_cache.move_to_end(cache_key)
+            return cached[2]
+        tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+        self._tags_cache[cache_key] = (file_item.checksum, file_item.file_size, tags)
+        self._tags_cache.move_to_end(cache_key)
+        if len(self._tags_cache) > TAGS_CACHE_MAX_ITEMS:
+            self._tags_cache.popitem(last=False)
+        return tags
+
     def get_absolute_path(self, file_path: str) -> str:
         """Return absolute path for given file path."""
         return get_absolute_path(self.base_path, file_path)
@@ -1562,7 +1626,7 @@ class LocalFileSystemProvider(MusicProvider):
         if library_item is None:
             # this could be a file that has just been added, try parsing it
             file_item = await self.resolve(item_id)
-            tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+            tags = await self._get_file_tags(file_item)
             if not (library_item := await self._parse_track(file_item, tags)):
                 msg = f"Item not found: {item_id}"
                 raise MediaNotFoundError(msg)
@@ -1588,7 +1652,7 @@ class LocalFileSystemProvider(MusicProvider):
         """Return the streamdetails for a podcast episode."""
         # podcasts episodes are never stored in the library so we need to parse the file
         file_item = await self.resolve(item_id)
-        tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+        tags = await self._get_file_tags(file_item)
         return StreamDetails(
             provider=self.instance_id,
             item_id=item_id,
@@ -1617,7 +1681,7 @@ class LocalFileSystemProvider(MusicProvider):
         if library_item is None:
             # this could be a file that has just been added, try parsing it
             file_item = await self.resolve(item_id)
-            tags = await async_parse_tags(file_item.absolute_path, file_item.file_size)
+            tags = await self._get_file_tags(file_item)
             if not (library_item := await self._parse_audiobook(file_item, tags)):
                 msg = f"Item not found: {item_id}"
                 raise MediaNotFoundError(msg)
@@ -1692,7 +1756,7 @@ class LocalFileSystemProvider(MusicProvider):
                 continue
             if item.ext not in AUDIOBOOK_EXTENSIONS:
                 continue
-            item_tags = await async_parse_tags(item.absolute_path, item.file_size)
+            item_tags = await self._get_file_tags(item)
             if not (tags.album == item_tags.album or (item_tags.tags.get("title") is None)):
                 continue
             if item_tags.track is None:
@@ -99,6 +99,18 @@ SUPPORTED_EXTENSIONS = {
     *PLAYLIST_EXTENSIONS,
 }
 
+# the (audio) file extensions we parse tags for, per media content type
+TAGGED_EXTENSIONS = {
+    "music": TRACK_EXTENSIONS,
+    "audiobooks": AUDIOBOOK_EXTENSIONS,
+    "podcasts": PODCAST_EPISODE_EXTENSIONS,
+}
+
+# number of files to parse tags for (with ffprobe) concurrently during a library sync
+SYNC_TAG_PARSE_WORKERS = 4
+# max number of parsed files to keep (in memory) in the tags cache
+TAGS_CACHE_MAX_ITEMS = 500
+
 
 SUPPORTED_FEATURES = {
     ProviderFeature.LIBRARY_ARTISTS,
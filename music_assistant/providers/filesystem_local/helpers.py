@@ -5,6 +5,10 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import xmltodict
 
 from music_assistant.helpers.compare import compare_strings
 
@@ -34,11 +38,9 @@ class FileSystemItem:
     @property
     def ext(self) -> str | None:
         """Return file extension."""
-        try:
-            # convert to lowercase to make it case insensitive when comparing
-            return self.filename.rsplit(".", 1)[1].lower()
-        except IndexError:
-            return None
+        _, sep, ext = self.filename.rpartition(".")
+        # convert to lowercase to make it case insensitive when comparing
+        return ext.lower() if sep else None
 
     @property
     def name(self) -> str:
@@ -146,8 +148,10 @@ def _dir_contains_album_name(id3_album_name: str, directory_name: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=256)
 def get_album_dir(track_dir: str, album_name: str) -> str | None:
     """Return album/parent directory of a track."""
+    # NOTE: cached as all tracks of an album resolve to the same result
     parentdir = track_dir
     # account for disc sublevel by ignoring 1 level if needed
     for _ in range(2):
@@ -191,8 +195,7 @@ def get_album_dir(track_dir: str, album_name: str) -> str | None:
 
 def get_relative_path(base_path: str, path: str) -> str:
     """Return the relative path string for a path."""
-    if path.startswith(base_path):
-        path = path.split(base_path)[1]
+    path = path.removeprefix(base_path)
     for sep in ("/", "\\"):
         if path.startswith(sep):
             path = path[1:]
@@ -219,14 +222,15 @@ def sorted_scandir(base_path: str, sub_path: str, sort: bool = False) -> list[Fi
 
     if base_path not in sub_path:
         sub_path = os.path.join(base_path, sub_path)
-    items = [
-        FileSystemItem.from_dir_entry(x, base_path)
-        for x in os.scandir(sub_path)
-        # filter out invalid dirs and hidden files
-        if (x.is_dir(follow_symlinks=False) or x.is_file(follow_symlinks=False))
-        and x.name not in IGNORE_DIRS
-        and not x.name.startswith(".")
-    ]
+    with os.scandir(sub_path) as it:
+        items = [
+            FileSystemItem.from_dir_entry(x, base_path)
+            for x in it
+            # filter out invalid dirs and hidden files
+            if (x.is_dir(follow_symlinks=False) or x.is_file(follow_symlinks=False))
+            and x.name not in IGNORE_DIRS
+            and not x.name.startswith(".")
+        ]
     if sort:
         return sorted(
             items,
@@ -234,3 +238,17 @@ def sorted_scandir(base_path: str, sub_path: str, sort: bool = False) -> list[Fi
             key=lambda x: nat_key(x.name),
         )
     return items
+
+
+def read_nfo_file(path: str) -> dict[str, Any] | None:
+    """
+    Read and parse a (Kodi style) NFO file, returns None if the file does not exist.
+
+    Not async friendly!
+    """
+    try:
+        with open(path, encoding="utf-8") as _file:
+            data = _file.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    return xmltodict.parse(data)
@@ -219,7 +219,7 @@ async def _get_player_control_config_entries(hass: HomeAssistantClient) -> tuple
         if "friendly_name" not in state["attributes"]:
             # filter out invalid/unavailable players
             continue
-        entity_platform = state["entity_id"].split(".")[0]
+        entity_platform = state["entity_id"].partition(".")[0]
         name = f"{state['attributes']['friendly_name']} ({state['entity_id']})"
 
         if entity_platform in ("switch", "input_boolean"):
@@ -355,9 +355,9 @@ class HomeAssistantProvider(PluginProvider):
 
     async def _register_player_controls(self) -> None:
         """Register all player controls."""
-        power_controls = cast(list[str], self.config.get_value(CONF_POWER_CONTROLS))
-        mute_controls = cast(list[str], self.config.get_value(CONF_MUTE_CONTROLS))
-        volume_controls = cast(list[str], self.config.get_value(CONF_VOLUME_CONTROLS))
+        power_controls = set(cast(list[str], self.config.get_value(CONF_POWER_CONTROLS)))
+        mute_controls = set(cast(list[str], self.config.get_value(CONF_MUTE_CONTROLS)))
+        volume_controls = set(cast(list[str], self.config.get_value(CONF_VOLUME_CONTROLS)))
         control_entity_ids: set[str] = {
             *power_controls,
             *mute_controls,
@@ -470,21 +470,34 @@ class HomeAssistantProvider(PluginProvider):
             return
         if not (player_control := self._player_controls.get(entity_id)):
             return
-        entity_platform = entity_id.split(".")[0]
+        is_media_player = entity_id.startswith("media_player.")
+        prev_values = (
+            player_control.power_state,
+            player_control.volume_level,
+            player_control.volume_muted,
+        )
         if "s" in state:
             # state changed
             if player_control.supports_power:
                 player_control.power_state = state["s"] not in OFF_STATES
-            if player_control.supports_mute and entity_platform != "media_player":
+            if player_control.supports_mute and not is_media_player:
                 player_control.volume_muted = state["s"] not in OFF_STATES
-            if player_control.supports_volume and entity_platform != "media_player":
+            if player_control.supports_volume and not is_media_player:
                 player_control.volume_level = try_parse_int(state["s"]) or 0
         if "a" in state and (attributes := state["a"]):
             if player_control.supports_volume:
-                if entity_platform == "media_player":
+                if is_media_player:
                     player_control.volume_level = attributes.get("volume_level", 0) * 100
                 else:
                     player_control.volume_level = try_parse_int(attributes.get("value")) or 0
-            if player_control.supports_mute and entity_platform == "media_player":
+            if player_control.supports_mute and is_media_player:
                 player_control.volume_muted = attributes.get("volume_muted")
+        if prev_values == (
+            player_control.power_state,
+            player_control.volume_level,
+            player_control.volume_muted,
+        ):
+            # nothing changed that is relevant for the control (e.g. a media position update),
+            # prevent a (costly) update of all players that are using this control
+            return
         self.mass.players.update_player_control(entity_id)
@@ -519,59 +519,61 @@ class HomeAssistantPlayers(PlayerProvider):
 
     def _on_entity_state_update(self, event: EntityStateEvent) -> None:
         """Handle Entity State event."""
-
-        def update_player_from_state_msg(entity_id: str, state: CompressedState) -> None:
-            """Handle updating MA player with updated info in a HA CompressedState."""
-            player = self.mass.players.get(entity_id)
-            if player is None:
-                # edge case - one of our subscribed entities was not available at startup
-                # and now came available - we should still set it up
-                player_ids: list[str] = self.config.get_value(CONF_PLAYERS)
-                if entity_id not in player_ids:
-                    return  # should not happen, but guard just in case
-                self.mass.create_task(self._late_add_player(entity_id))
-                return
-            if "s" in state:
-                player.state = StateMap.get(state["s"], PlayerState.IDLE)
-                player.available = state["s"] not in UNAVAILABLE_STATES
-                if PlayerFeature.POWER in player.supported_features:
-                    player.powered = state["s"] not in OFF_STATES
-            if "a" in state:
-                self._update_player_attributes(player, state["a"])
-            self.mass.players.update(entity_id)
-
         if entity_additions := event.get("a"):
             for entity_id, state in entity_additions.items():
-                update_player_from_state_msg(entity_id, state)
+                self._update_player_from_state_msg(entity_id, state)
         if entity_changes := event.get("c"):
             for entity_id, state_diff in entity_changes.items():
                 if "+" not in state_diff:
                     continue
-                update_player_from_state_msg(entity_id, state_diff["+"])
+                self._update_player_from_state_msg(entity_id, state_diff["+"])
+
+    def _update_player_from_state_msg(self, entity_id: str, state: CompressedState) -> None:
+        """Handle updating MA player with updated info in a HA CompressedState."""
+        player = self.mass.players.get(entity_id)
+        if player is None:
+            # edge case - one of our subscribed entities was not available at startup
+            # and now came available - we should still set it up
+            player_ids: list[str] = self.config.get_value(CONF_PLAYERS)
+            if entity_id not in player_ids:
+                return  # should not happen, but guard just in case
+            self.mass.create_task(self._late_add_player(entity_id))
+            return
+        if "s" in state:
+            player.state = StateMap.get(state["s"], PlayerState.IDLE)
+            player.available = state["s"] not in UNAVAILABLE_STATES
+            if PlayerFeature.POWER in player.supported_features:
+                player.powered = state["s"] not in OFF_STATES
+        if "a" in state:
+            self._update_player_attributes(player, state["a"])
+        self.mass.players.update(entity_id)
 
     def _update_player_attributes(self, player: Player, attributes: dict[str, Any]) -> None:
         """Update Player attributes from HA state attributes."""
-        for key, value in attributes.items():
-            if key == "media_position":
-                player.elapsed_time = value
-            if key == "media_position_updated_at":
-                player.elapsed_time_last_updated = from_iso_string(value).timestamp()
-            if key == "volume_level":
-                player.volume_level = int(value * 100)
-            if key == "volume_muted":
-                player.volume_muted = value
-            if key == "media_content_id":
-                player.current_item_id = value
-            if key == "group_members":
-                if value and value[0] == player.player_id:
-                    player.group_childs.set(value)
-                    player.synced_to = None
-                elif value and value[0] != player.player_id:
-                    player.group_childs.clear()
-                    player.synced_to = value[0]
-                else:
-                    player.group_childs.clear()
-                    player.synced_to = None
+        # look up the few attributes we handle instead of matching every attribute key
+        if "media_position" in attributes:
+            player.elapsed_time = attributes["media_position"]
+        if "media_position_updated_at" in attributes:
+            player.elapsed_time_last_updated = from_iso_string(
+                attributes["media_position_updated_at"]
+            ).timestamp()
+        if "volume_level" in attributes:
+            player.volume_level = int(attributes["volume_level"] * 100)
+        if "volume_muted" in attributes:
+            player.volume_muted = attributes["volume_muted"]
+        if "media_content_id" in attributes:
+            player.current_item_id = attributes["media_content_id"]
+        if "group_members" in attributes:
+            value = attributes["group_members"]
+            if value and value[0] == player.player_id:
+                player.group_childs.set(value)
+                player.synced_to = None
+            elif value and value[0] != player.player_id:
+                player.group_childs.clear()
+                player.synced_to = value[0]
+            else:
+                player.group_childs.clear()
+                player.synced_to = None
 
     async def _late_add_player(self, entity_id: str) -> None:
         """Handle setup of Player from HA entity that became available after startup."""
@@ -0,0 +1,67 @@
+# Copyright 2026 The Music Assistant Authors
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the music controller."""
+
+from unittest import mock
+
+from music_assistant_models.media_items import ProviderMapping, Radio
+
+from music_assistant.mass import MusicAssistant
+
+
+async def test_loudness_cache(mass: MusicAssistant) -> None:
+    """Test that loudness lookups are memoized and refreshed when a new value is stored."""
+    get_row = mock.AsyncMock(wraps=mass.music.database.get_row)
+    with mock.patch.object(mass.music.database, "get_row", get_row):
+        assert await mass.music.get_loudness("1", "builtin") is None
+        assert await mass.music.get_loudness("1", "builtin") is None
+        # a missing measurement is remembered too
+        assert get_row.await_count == 1
+        await mass.music.set_loudness("1", "builtin", -10.0, -11.0)
+        assert await mass.music.get_loudness("1", "builtin") == (-10.0, -11.0)
+        assert await mass.music.get_loudness("1", "builtin") == (-10.0, -11.0)
+        assert get_row.await_count == 2
+        # other items are not affected
+        assert await mass.music.get_loudness("2", "builtin") is None
+        assert get_row.await_count == 3
+
+
+async def test_iter_library_items_keyset(mass: MusicAssistant) -> None:
+    """Test iterating library items without ordering pages past the page size."""
+    for index in range(1100):
+        await mass.music.radio._add_library_item(
+            Radio(
+                item_id=str(index),
+                provider="builtin",
+                name=f"Radio {index}",
+                favorite=index % 2 == 0,
+                provider_mappings={
+                    ProviderMapping(
+                        item_id=str(index),
+                        provider_domain="builtin",
+                        provider_instance="builtin",
+                    )
+                },
+            )
+        )
+    get_rows = mock.AsyncMock(wraps=mass.music.database.get_rows_from_query)
+    with mock.patch.object(mass.music.database, "get_rows_from_query", get_rows):
+        item_ids = [
+            int(item.item_id) async for item in mass.music.radio.iter_library_items(order_by=None)
+        ]
+    assert len(item_ids) == 1100
+    assert item_ids == sorted(item_ids)
+    # three pages, each one a keyset lookup instead of an offset
+    assert get_rows.await_count == 3
+    assert all(call.kwargs["offset"] == 0 for call in get_rows.await_args_list)
+    # an OR in the extra query must not bypass the paging (and yield items twice)
+    item_ids = [
+        int(item.item_id)
+        async for item in mass.music.radio.iter_library_items(
+            order_by=None,
+            extra_query="WHERE radios.favorite = :favorite OR radios.favorite = :not_favorite",
+            extra_query_params={"favorite": True, "not_favorite": False},
+        )
+    ]
+    assert len(item_ids) == 1100
+    assert len(set(item_ids)) == 1100
@@ -74,3 +74,16 @@ async def test_parse_metadata_from_invalid_filename() -> None:
     assert _tags.musicbrainz_artistids == ()
     assert _tags.musicbrainz_releasegroupid is None
     assert _tags.musicbrainz_recordingid is None
+
+
+def test_parse_tags_mutagen_skips_non_id3_extensions(tmp_path: pathlib.Path) -> None:
+    """Test that only files with an ID3 carrying extension are parsed with mutagen."""
+    data = pathlib.Path(FILE_1).read_bytes()
+    for ext in ("mp3", "mpeg", "MP3"):
+        id3_file = tmp_path.joinpath(f"id3.{ext}")
+        id3_file.write_bytes(data)
+        assert tags.parse_tags_mutagen(str(id3_file))["title"] == "MyTitle"
+    # same (ID3 tagged) data but an extension mutagen should not even try
+    other_file = tmp_path.joinpath("other.flac")
+    other_file.write_bytes(data)
+    assert tags.parse_tags_mutagen(str(other_file)) == {}
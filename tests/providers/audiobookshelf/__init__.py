@@ -0,0 +1,3 @@
+# Copyright 2026 The Music Assistant Authors
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for Audiobookshelf provider."""
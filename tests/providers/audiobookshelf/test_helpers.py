@@ -0,0 +1,149 @@
+# Copyright 2026 The Music Assistant Authors
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the Audiobookshelf helpers."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from music_assistant.providers.audiobookshelf import helpers
+
+
+async def _generate(
+    name: str, count: int, delay: float = 0, error: Exception | None = None
+) -> AsyncGenerator[str, None]:
+    for index in range(count):
+        await asyncio.sleep(delay)
+        yield f"{name}{index}"
+    if error is not None:
+        raise error
+
+
+async def test_merge_async_generators_order() -> None:
+    """Test that all items are yielded and the order of each generator is kept."""
+    result = [
+        item
+        async for item in helpers.merge_async_generators(
+            _generate("a", 5, 0.002), _generate("b", 3, 0.003), _generate("c", 0)
+        )
+    ]
+    assert sorted(result) == sorted(["a0", "a1", "a2", "a3", "a4", "b0", "b1", "b2"])
+    assert [x for x in result if x.startswith("a")] == ["a0", "a1", "a2", "a3", "a4"]
+    assert [x for x in result if x.startswith("b")] == ["b0", "b1", "b2"]
+
+
+async def test_merge_async_generators_error() -> None:
+    """Test that an exception is raised after the items preceding it were yielded."""
+    result: list[str] = []
+
+    async def _consume() -> None:
+        async for item in helpers.merge_async_generators(
+            _generate("a", 2, error=ValueError("broken"))
+        ):
+            result.append(item)
+
+    with pytest.raises(ValueError, match="broken"):
+        await _consume()
+    assert result == ["a0", "a1"]
+
+
+async def test_merge_async_generators_cancel() -> None:
+    """Test that leaving the consumer early stops (and closes) the producers."""
+    closed: list[str] = []
+
+    async def _endless(name: str) -> AsyncGenerator[str, None]:
+        try:
+            while True:
+                await asyncio.sleep(0)
+                yield name
+        finally:
+            closed.append(name)
+
+    merged = helpers.merge_async_generators(_endless("a"), _endless("b"))
+    async for _ in merged:
+        break
+    await merged.aclose()
+    assert sorted(closed) == ["a", "b"]
+
+
+class _Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Patch the clock of the helpers module."""
+    _clock = _Clock()
+    monkeypatch.setattr(helpers.time, "monotonic", _clock)
+    return _clock
+
+
+def test_item_cache_expiry(clock: _Clock) -> None:
+    """Test that items expire after the ttl."""
+    cache: helpers.ItemCache[str] = helpers.ItemCache(ttl=60)
+    cache.set("item", "value")
+    clock.now += 59
+    assert cache.get("item") == "value"
+    clock.now += 2
+    assert cache.get("item") is None
+
+
+@pytest.mark.usefixtures("clock")
+def test_item_cache_lru() -> None:
+    """Test that the least recently used item is dropped once full."""
+    cache: helpers.ItemCache[str] = helpers.ItemCache(max_items=2)
+    cache.set("item1", "value1")
+    cache.set("item2", "value2")
+    assert cache.get("item1") == "value1"
+    cache.set("item3", "value3")
+    assert cache.get("item2") is None
+    assert cache.get("item1") == "value1"
+    assert cache.get("item3") == "value3"
+
+
+async def test_item_cache_coalesce() -> None:
+    """Test that concurrent fetches of the same item result in a single fetch."""
+    cache: helpers.ItemCache[str] = helpers.ItemCache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def _fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    tasks = [asyncio.create_task(cache.get_or_fetch("item", _fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    # a cancelled caller must not abort the fetch for the others
+    tasks[0].cancel()
+    release.set()
+    assert await asyncio.gather(*tasks[1:]) == ["value", "value"]
+    assert calls == 1
+    # the result is stored
+    assert await cache.get_or_fetch("item", _fetch) == "value"
+    assert calls == 1
+
+
+async def test_item_cache_remove_inflight() -> None:
+    """Test that removing an item while it is fetched discards the (outdated) result."""
+    cache: helpers.ItemCache[str] = helpers.ItemCache()
+    release = asyncio.Event()
+
+    async def _fetch() -> str:
+        await release.wait()
+        return "outdated"
+
+    task = asyncio.create_task(cache.get_or_fetch("item", _fetch))
+    await asyncio.sleep(0)
+    cache.remove("item")
+    release.set()
+    assert await task == "outdated"
+    assert cache.get("item") is None
@@ -0,0 +1,69 @@
+# Copyright 2026 The Music Assistant Authors
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the Filesystem provider."""
+
+import os
+import pathlib
+import shutil
+from unittest import mock
+
+import pytest
+
+from music_assistant.helpers.tags import async_parse_tags
+from music_assistant.mass import MusicAssistant
+from music_assistant.providers import filesystem_local
+from tests.common import wait_for_sync_completion
+
+FIXTURE_FILE = pathlib.Path(__file__).parent.parent.parent.joinpath(
+    "fixtures", "MyArtist - MyTitle.mp3"
+)
+
+
+@pytest.fixture
+async def filesystem_provider(
+    mass: MusicAssistant, tmp_path: pathlib.Path
+) -> filesystem_local.LocalFileSystemProvider:
+    """Add a filesystem provider for an (initially empty) music directory to mass."""
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    async with wait_for_sync_completion(mass):
+        config = await mass.config.save_provider_config(
+            "filesystem_local", {"path": str(music_dir)}
+        )
+    provider = mass.get_provider(config.instance_id)
+    assert isinstance(provider, filesystem_local.LocalFileSystemProvider)
+    return provider
+
+
+async def test_file_tags_cache(
+    filesystem_provider: filesystem_local.LocalFileSystemProvider,
+) -> None:
+    """Test that parsed tags are reused until the file changes."""
+    for name in ("a", "b", "c"):
+        shutil.copyfile(FIXTURE_FILE, os.path.join(filesystem_provider.base_path, f"{name}.mp3"))
+    parse_tags = mock.AsyncMock(wraps=async_parse_tags)
+    with (
+        mock.patch.object(filesystem_local, "async_parse_tags", parse_tags),
+        mock.patch.object(filesystem_local, "TAGS_CACHE_MAX_ITEMS", 2),
+    ):
+        file_a = await filesystem_provider.resolve("a.mp3")
+        assert (await filesystem_provider._get_file_tags(file_a)).title == "MyTitle"
+        assert (await filesystem_provider._get_file_tags(file_a)).title == "MyTitle"
+        assert parse_tags.await_count == 1
+        # a modified file (checksum) invalidates the cached tags
+        mtime = os.stat(file_a.absolute_path).st_mtime + 10
+        os.utime(file_a.absolute_path, (mtime, mtime))
+        file_a = await filesystem_provider.resolve("a.mp3")
+        await filesystem_provider._get_file_tags(file_a)
+        assert parse_tags.await_count == 2
+        # the least recently used file is dropped once full
+        file_b = await filesystem_provider.resolve("b.mp3")
+        file_c = await filesystem_provider.resolve("c.mp3")
+        await filesystem_provider._get_file_tags(file_b)
+        await filesystem_provider._get_file_tags(file_a)
+        await filesystem_provider._get_file_tags(file_c)
+        assert parse_tags.await_count == 4
+        assert list(filesystem_provider._tags_cache) == [
+            file_a.relative_path,
+            file_c.relative_path,
+        ]